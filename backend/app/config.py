@@ -1,7 +1,16 @@
 """Configuration settings for the FastAPI backend."""
+import os
+import re
+from functools import lru_cache
 from pydantic_settings import BaseSettings
-from typing import List
-from pydantic import Field
+from typing import FrozenSet, List, Optional
+from pydantic import Field, PrivateAttr
+
+# URL prefixes that mark a path as already absolute
+_URL_SCHEMES = ("http://", "https://")
+
+# Matches one comma-separated token with surrounding whitespace excluded
+_CSV_TOKEN_RE = re.compile(r"[^,\s][^,]*[^,\s]|[^,\s]")
 
 
 class Settings(BaseSettings):
@@ -31,6 +40,10 @@ class Settings(BaseSettings):
     # CORS Configuration (comma-separated string)
     CORS_ORIGINS: str = "http://localhost:3000"
     
+    # Routers to leave out of this worker (comma-separated module names under
+    # app/routers, e.g. "whisper,composition"); skipped modules are never imported
+    DISABLED_ROUTERS: str = ""
+    
     # Backend API Base URL (for generating full URLs for external services)
     API_BASE_URL: str = "http://localhost:8000"
     
@@ -76,6 +89,30 @@ class Settings(BaseSettings):
         description="Alert threshold for daily Kontext generations"
     )
     
+    # Database cache sizing (per worker process)
+    DB_CACHE_MAXSIZE: int = Field(
+        default=10_000,
+        description="Max entries in each in-memory Firestore cache and index"
+    )
+    
+    # Optional Redis shared cache (scene + prediction-id lookups across workers).
+    # Leave empty to keep caches per-process; requires the `redis` package.
+    REDIS_URL: str = ""
+    
+    # Derived values, computed on first access (settings are immutable after load)
+    _cors_origins: Optional[List[str]] = PrivateAttr(default=None)
+    _replicate_token: Optional[str] = PrivateAttr(default=None)
+    _base_url: str = PrivateAttr(default="")
+    _webhook_url: str = PrivateAttr(default="")
+    _use_webhooks: bool = PrivateAttr(default=False)
+    
+    def model_post_init(self, __context) -> None:
+        """Precompute values used on every outgoing request."""
+        self._base_url = self.API_BASE_URL.rstrip("/")
+        self._webhook_url = f"{self._base_url}/api/webhooks/replicate"
+        force_webhooks = os.getenv("FORCE_WEBHOOKS", "").lower() in ("true", "1", "yes")
+        self._use_webhooks = force_webhooks or not self.is_development()
+    
     def is_development(self) -> bool:
         """Check if running in development mode."""
         return self.ENVIRONMENT.lower() in ("development", "dev", "local")
@@ -88,21 +125,28 @@ class Settings(BaseSettings):
         Returns False in development (simple, no ngrok needed)
         
         Can be overridden with FORCE_WEBHOOKS=true environment variable
-        for testing webhooks locally with ngrok.
+        for testing webhooks locally with ngrok (read once at startup).
         """
-        import os
-        force_webhooks = os.getenv("FORCE_WEBHOOKS", "").lower() in ("true", "1", "yes")
-        return force_webhooks or not self.is_development()
+        return self._use_webhooks
+    
+    def get_disabled_routers(self) -> FrozenSet[str]:
+        """Get the router modules this worker should not load."""
+        return frozenset(m.group(0) for m in _CSV_TOKEN_RE.finditer(self.DISABLED_ROUTERS))
     
     def get_cors_origins(self) -> List[str]:
         """Get CORS origins as a list from comma-separated string."""
-        if not self.CORS_ORIGINS:
-            return ["http://localhost:3000"]
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()]
+        if self._cors_origins is None:
+            if not self.CORS_ORIGINS:
+                self._cors_origins = ["http://localhost:3000"]
+            else:
+                self._cors_origins = [m.group(0) for m in _CSV_TOKEN_RE.finditer(self.CORS_ORIGINS)]
+        return self._cors_origins
     
     def get_replicate_token(self) -> str:
         """Get Replicate API token, checking both field names."""
-        return self.REPLICATE_API_TOKEN or self.REPLICATE_API_KEY
+        if self._replicate_token is None:
+            self._replicate_token = self.REPLICATE_API_TOKEN or self.REPLICATE_API_KEY
+        return self._replicate_token
     
     def get_webhook_url(self) -> str:
         """
@@ -111,8 +155,7 @@ class Settings(BaseSettings):
         Returns:
             Full webhook URL (e.g., https://xxxx.ngrok.io/api/webhooks/replicate)
         """
-        base_url = self.API_BASE_URL.rstrip("/")
-        return f"{base_url}/api/webhooks/replicate"
+        return self._webhook_url
     
     def to_full_url(self, path: str) -> str:
         """
@@ -131,16 +174,15 @@ class Settings(BaseSettings):
             return path
         
         # If already a full URL, return as-is
-        if path.startswith(("http://", "https://")):
+        if path.startswith(_URL_SCHEMES):
             return path
         
         # Ensure path starts with /
         if not path.startswith("/"):
             path = f"/{path}"
         
-        # Remove trailing slash from base URL and prepend to path
-        base_url = self.API_BASE_URL.rstrip("/")
-        return f"{base_url}{path}"
+        # Prepend base URL (trailing slash stripped at init)
+        return f"{self._base_url}{path}"
     
     class Config:
         env_file = ".env"
@@ -148,6 +190,19 @@ class Settings(BaseSettings):
         extra = "ignore"  # Ignore extra fields in .env
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the global settings instance, loading .env on first call."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    """Create the global ``settings`` instance lazily on first access.
+
+    ``from app.config import settings`` keeps working, but scripts and test
+    collection that only import this module no longer pay for .env parsing.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -7,6 +7,13 @@ The database is a drop-in replacement for the old InMemoryDatabase with
 the same interface, but data now persists across backend restarts.
 """
 
-from app.firestore_database import db
+from app.firestore_database import get_db
 
-__all__ = ['db']
+__all__ = ['db', 'get_db']
+
+
+def __getattr__(name: str):
+    """Resolve ``db`` lazily so importing this module doesn't touch Firestore."""
+    if name == "db":
+        return get_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
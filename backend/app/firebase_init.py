@@ -0,0 +1,57 @@
+"""Shared Firebase Admin SDK initialization.
+
+Firestore, auth and Storage all need the same default Firebase app. This
+module creates it once per process so the service account key is read and
+parsed a single time, whichever subsystem asks first.
+"""
+from functools import lru_cache
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Backend root, used to resolve a relative credentials path when the process
+# wasn't started from the backend directory
+_BACKEND_DIR = Path(__file__).parent.parent
+
+
+def _resolve_credentials_path() -> Path:
+    """Locate the service account key from FIREBASE_CREDENTIALS_PATH."""
+    from app.config import settings
+
+    cred_path = Path(settings.FIREBASE_CREDENTIALS_PATH)
+    if not cred_path.exists() and not cred_path.is_absolute():
+        cred_path = _BACKEND_DIR / cred_path
+    return cred_path
+
+
+@lru_cache(maxsize=1)
+def get_firebase_app():
+    """Get the default Firebase app, initializing the SDK on first call.
+
+    Raises:
+        FileNotFoundError: If the service account key can't be found
+    """
+    import firebase_admin
+    from firebase_admin import credentials
+
+    try:
+        return firebase_admin.get_app()
+    except ValueError:
+        pass
+
+    cred_path = _resolve_credentials_path()
+    if not cred_path.exists():
+        raise FileNotFoundError(
+            f"Firebase credentials not found at {cred_path}. "
+            "Add serviceAccountKey.json to the backend directory."
+        )
+
+    from app.config import settings
+    options = {}
+    if settings.FIREBASE_STORAGE_BUCKET:
+        options['storageBucket'] = settings.FIREBASE_STORAGE_BUCKET
+
+    app = firebase_admin.initialize_app(credentials.Certificate(str(cred_path)), options or None)
+    logger.info("Firebase Admin SDK initialized")
+    return app
@@ -4,16 +4,81 @@ This module provides a persistent database layer using Google Cloud Firestore
 with an in-memory cache for performance. Firestore is REQUIRED - the app will
 fail fast on startup if not properly configured.
 """
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set
+from contextvars import ContextVar
+import asyncio
+import sys
+import threading
 from app.models.storyboard_models import Storyboard, StoryboardScene
 from datetime import datetime
-import firebase_admin
-from firebase_admin import credentials, firestore
-from pathlib import Path
+from cachetools import LRUCache, TTLCache
+from functools import lru_cache
+from app.utils.redis_client import connect_redis
+from app.utils.serialization import to_json_bytes
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Firestore caps a WriteBatch at 500 operations
+_BATCH_WRITE_LIMIT = 500
+
+# Negative cache for ids that were not found. The TTL is short because
+# another worker process may create the document in the meantime.
+_MISSING_CACHE_MAXSIZE = 1024
+_MISSING_CACHE_TTL_SECONDS = 30
+
+# How long a storyboard's scene-id set is trusted before re-querying, which
+# bounds how late scenes added by another worker process show up
+_SCENE_INDEX_TTL_SECONDS = 30
+
+# Documents fetched per page when streaming asset listings
+_ASSET_PAGE_SIZE = 200
+
+# Lifetime of shared (Redis) scene and prediction-id entries
+_SHARED_CACHE_TTL_SECONDS = 3600
+
+
+# Request-scoped cache, installed per HTTP request by RequestCacheMiddleware.
+# Consulted after the process LRU, so entries evicted mid-request are not
+# refetched; None outside a request (scripts, tests).
+request_cache: ContextVar[Optional[Dict[tuple, Any]]] = ContextVar(
+    "firestore_request_cache", default=None
+)
+
+
+def _remember(kind: str, key: str, value):
+    """Record a value in the current request's cache (if any) and return it."""
+    cache = request_cache.get()
+    if cache is not None:
+        cache[(kind, key)] = value
+    return value
+
+
+def _recall(kind: str, key: str):
+    """Get a value from the current request's cache, or None."""
+    cache = request_cache.get()
+    return cache.get((kind, key)) if cache is not None else None
+
+
+def _forget(kind: str, key: str) -> None:
+    """Drop a deleted item from the current request's cache."""
+    cache = request_cache.get()
+    if cache is not None:
+        cache.pop((kind, key), None)
+
+
+class _EvictingLRUCache(LRUCache):
+    """LRUCache that calls ``on_evict(key, value)`` for entries it evicts."""
+    
+    def __init__(self, maxsize: int, on_evict):
+        super().__init__(maxsize=maxsize)
+        self._on_evict = on_evict
+    
+    def popitem(self):
+        key, value = super().popitem()
+        self._on_evict(key, value)
+        return key, value
+
 
 class FirestoreDatabase:
     """Firestore database with in-memory cache for performance.
@@ -21,7 +86,7 @@ class FirestoreDatabase:
     Architecture:
     - Writes: Firestore first (persistence), then cache (speed)
     - Reads: Cache first (speed), then Firestore (persistence)
-    - Cache: In-memory dict for fast lookups
+    - Cache: Bounded in-memory LRU for fast lookups
     - Persistence: Firestore for durability across restarts
     """
     
@@ -32,10 +97,45 @@ class FirestoreDatabase:
             FileNotFoundError: If serviceAccountKey.json not found
             RuntimeError: If Firestore initialization fails
         """
-        # In-memory cache for fast reads
-        self._cache_storyboards: Dict[str, Storyboard] = {}
-        self._cache_scenes: Dict[str, StoryboardScene] = {}
-        self._cache_assets: Dict[str, Dict] = {}  # asset_id -> asset_metadata
+        from app.config import settings
+        maxsize = settings.DB_CACHE_MAXSIZE
+        
+        # Guards every cache and index below. The sync methods run on the
+        # event loop and in to_thread workers at the same time, and cachetools
+        # caches reorder themselves even on reads. Re-entrant because LRU
+        # eviction calls back into _drop_prediction_index. Never held across
+        # Firestore or Redis I/O.
+        self._lock = threading.RLock()
+        
+        # Bounded in-memory LRU caches for fast reads; evicted entries are
+        # simply reloaded from Firestore on the next miss
+        self._cache_storyboards: LRUCache[str, Storyboard] = LRUCache(maxsize=maxsize)
+        self._cache_scenes: LRUCache[str, StoryboardScene] = _EvictingLRUCache(
+            maxsize=maxsize, on_evict=self._drop_prediction_index
+        )
+        self._cache_assets: LRUCache[str, Dict] = LRUCache(maxsize=maxsize)  # asset_id -> asset_metadata
+        # Recently-missing ids, so repeated polls for deleted items skip Firestore
+        self._missing_storyboards: TTLCache[str, bool] = TTLCache(
+            maxsize=_MISSING_CACHE_MAXSIZE, ttl=_MISSING_CACHE_TTL_SECONDS
+        )
+        self._missing_scenes: TTLCache[str, bool] = TTLCache(
+            maxsize=_MISSING_CACHE_MAXSIZE, ttl=_MISSING_CACHE_TTL_SECONDS
+        )
+        # Views of the scene cache keyed by Replicate prediction_id, holding the
+        # cached scene objects themselves. Entries may go stale when a scene's
+        # prediction id is changed in place, so lookups verify them.
+        self._idx_image_pred: LRUCache[str, StoryboardScene] = LRUCache(maxsize=maxsize)
+        self._idx_video_pred: LRUCache[str, StoryboardScene] = LRUCache(maxsize=maxsize)
+        # asset_id -> owning user_id, so get_asset can skip the collection-group scan
+        self._idx_asset_user: LRUCache[str, str] = LRUCache(maxsize=maxsize)
+        # storyboard_id -> scene ids, filled by full queries and kept current
+        # by this process's own creates/deletes
+        self._idx_storyboard_scenes: TTLCache[str, Set[str]] = TTLCache(
+            maxsize=maxsize, ttl=_SCENE_INDEX_TTL_SECONDS
+        )
+
+        # Optional cross-worker cache; None means per-process caching only
+        self._redis = connect_redis(settings.REDIS_URL, "shared cache")
 
         # Initialize Firestore (REQUIRED - will raise if fails)
         self._init_firestore()
@@ -47,23 +147,20 @@ class FirestoreDatabase:
             FileNotFoundError: If serviceAccountKey.json not found
             RuntimeError: If Firestore client cannot be created
         """
-        # Check for service account key
-        cred_path = Path("serviceAccountKey.json")
-        if not cred_path.exists():
-            raise FileNotFoundError(
-                "serviceAccountKey.json not found. "
-                "Firestore is required for data persistence. "
-                "Add serviceAccountKey.json to the backend directory."
-            )
+        # Imported here so merely importing this module doesn't load the
+        # Firebase SDK (gRPC, protobuf, google-auth)
+        from firebase_admin import firestore
+        from app.firebase_init import get_firebase_app
+        
+        # Shared, once-per-process SDK init (raises FileNotFoundError if the
+        # key is missing - Firestore is required for data persistence)
+        firebase_app = get_firebase_app()
         
         try:
-            # Initialize Firebase Admin (only once)
-            if not firebase_admin._apps:
-                cred = credentials.Certificate(str(cred_path))
-                firebase_admin.initialize_app(cred)
-                logger.info("Firebase Admin SDK initialized")
-            
-            self._db = firestore.client()
+            self._db = firestore.client(firebase_app)
+            # Bind hot collection references once instead of per operation
+            self._storyboards_col = self._db.collection('storyboards')
+            self._scenes_col = self._db.collection('scenes')
             logger.info("✓ Firestore database initialized successfully")
             
         except Exception as e:
@@ -76,15 +173,8 @@ class FirestoreDatabase:
         - datetime objects must be converted to ISO strings or Firestore Timestamp
         - None values are acceptable (stored as null)
         """
-        data = storyboard.model_dump()
-        
-        # Convert datetime to ISO string
-        if isinstance(data.get('created_at'), datetime):
-            data['created_at'] = data['created_at'].isoformat()
-        if isinstance(data.get('updated_at'), datetime):
-            data['updated_at'] = data['updated_at'].isoformat()
-        
-        return data
+        # JSON mode emits datetimes as ISO strings from pydantic-core
+        return storyboard.model_dump(mode='json')
     
     def _scene_to_dict(self, scene: StoryboardScene) -> dict:
         """Convert Scene to Firestore-compatible dict.
@@ -93,15 +183,140 @@ class FirestoreDatabase:
         - datetime objects must be converted to ISO strings
         - None values are acceptable (stored as null)
         """
-        data = scene.model_dump()
+        # JSON mode emits datetimes as ISO strings from pydantic-core
+        return scene.model_dump(mode='json')
+    
+    @staticmethod
+    def _parse_timestamps(data: dict) -> dict:
+        """Turn stored ISO timestamp strings back into datetimes."""
+        for key in ('created_at', 'updated_at'):
+            value = data.get(key)
+            if isinstance(value, str):
+                data[key] = datetime.fromisoformat(value)
+        return data
+    
+    @staticmethod
+    def _intern_ids(data: dict, *keys: str) -> dict:
+        """Intern id strings so the cache keys, indexes and the many scenes
+        sharing one storyboard_id/user_id all point at a single object."""
+        for key in keys:
+            value = data.get(key)
+            if isinstance(value, str):
+                data[key] = sys.intern(value)
+        return data
+    
+    def _storyboard_from_dict(self, data: dict) -> Storyboard:
+        """Build a Storyboard from a Firestore dict without re-validating.
+        
+        Documents are written by _storyboard_to_dict from the same schema,
+        so they are already valid; only the timestamps need converting.
+        """
+        data = self._intern_ids(self._parse_timestamps(data), 'storyboard_id', 'project_id')
+        if isinstance(data.get('scene_order'), list):
+            data['scene_order'] = [sys.intern(scene_id) for scene_id in data['scene_order']]
+        return Storyboard.from_trusted(data)
+    
+    def _scene_from_dict(self, data: dict) -> StoryboardScene:
+        """Build a StoryboardScene from a Firestore dict without re-validating.
         
-        # Convert datetime to ISO string
-        if isinstance(data.get('created_at'), datetime):
-            data['created_at'] = data['created_at'].isoformat()
-        if isinstance(data.get('updated_at'), datetime):
-            data['updated_at'] = data['updated_at'].isoformat()
+        Documents are written by _scene_to_dict from the same schema, so
+        only the timestamps and the nested generation status need rebuilding.
+        """
+        data = self._intern_ids(self._parse_timestamps(data), 'id', 'storyboard_id')
+        return StoryboardScene.from_trusted(data)
+    
+    def _cache_scene(self, scene: StoryboardScene) -> StoryboardScene:
+        """Put a scene in the cache and index its prediction IDs."""
+        with self._lock:
+            replaced = self._cache_scenes.get(scene.id)
+            if replaced is not None and replaced is not scene:
+                self._drop_prediction_index(scene.id, replaced)
+            self._cache_scenes[scene.id] = scene
+            if scene.replicate_image_prediction_id:
+                self._idx_image_pred[scene.replicate_image_prediction_id] = scene
+            if scene.replicate_video_prediction_id:
+                self._idx_video_pred[scene.replicate_video_prediction_id] = scene
+        return _remember('scene', scene.id, scene)
+    
+    def _uncache_scene(self, scene_id: str) -> None:
+        """Drop a scene from the cache along with its prediction ID entries."""
+        _forget('scene', scene_id)
+        with self._lock:
+            scene = self._cache_scenes.pop(scene_id, None)
+            if scene is None:
+                return
+            self._idx_storyboard_scenes.get(scene.storyboard_id, set()).discard(scene_id)
+            self._drop_prediction_index(scene_id, scene)
+    
+    def _drop_prediction_index(self, scene_id: str, scene: StoryboardScene) -> None:
+        """Remove a scene's prediction ID entries (also the LRU eviction hook)."""
+        with self._lock:
+            if self._idx_image_pred.get(scene.replicate_image_prediction_id) is scene:
+                del self._idx_image_pred[scene.replicate_image_prediction_id]
+            if self._idx_video_pred.get(scene.replicate_video_prediction_id) is scene:
+                del self._idx_video_pred[scene.replicate_video_prediction_id]
+    
+    def _share_scenes(self, scenes: List[StoryboardScene]) -> None:
+        """Publish scenes and their prediction IDs to the shared cache.
         
-        return data
+        Lets a webhook landing on another worker find the scene without a
+        Firestore query. Stored as JSON, never pickle.
+        """
+        if self._redis is None:
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for scene in scenes:
+                pipe.setex(f"scene:{scene.id}", _SHARED_CACHE_TTL_SECONDS, to_json_bytes(scene))
+                if scene.replicate_image_prediction_id:
+                    pipe.setex(f"pred_img:{scene.replicate_image_prediction_id}",
+                               _SHARED_CACHE_TTL_SECONDS, scene.id)
+                if scene.replicate_video_prediction_id:
+                    pipe.setex(f"pred_vid:{scene.replicate_video_prediction_id}",
+                               _SHARED_CACHE_TTL_SECONDS, scene.id)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to write scenes to shared cache: {e}")
+    
+    def _unshare_scenes(self, scene_ids: List[str]) -> None:
+        """Remove deleted scenes from the shared cache."""
+        if self._redis is None or not scene_ids:
+            return
+        try:
+            self._redis.delete(*[f"scene:{scene_id}" for scene_id in scene_ids])
+        except Exception as e:
+            logger.warning(f"Failed to delete scenes from shared cache: {e}")
+    
+    def _shared_scene_by_prediction(self, key_prefix: str, field: str,
+                                    prediction_id: str) -> Optional[StoryboardScene]:
+        """Look a scene up by prediction ID in the shared cache."""
+        if self._redis is None:
+            return None
+        try:
+            scene_id = self._redis.get(f"{key_prefix}:{prediction_id}")
+            if not scene_id:
+                return None
+            raw = self._redis.get(f"scene:{scene_id.decode()}")
+            if not raw:
+                return None
+            # Written by another process, so validate rather than trust
+            scene = StoryboardScene.model_validate_json(raw)
+        except Exception as e:
+            logger.warning(f"Shared cache lookup failed for prediction {prediction_id}: {e}")
+            return None
+        if getattr(scene, field) != prediction_id:
+            return None
+        self._cache_scene(scene)
+        return scene
+    
+    def _commit_sets(self, writes: list) -> None:
+        """Write (doc_ref, data) pairs with WriteBatch commits of at most
+        _BATCH_WRITE_LIMIT operations each."""
+        for start in range(0, len(writes), _BATCH_WRITE_LIMIT):
+            batch = self._db.batch()
+            for doc_ref, data in writes[start:start + _BATCH_WRITE_LIMIT]:
+                batch.set(doc_ref, data)
+            batch.commit()
     
     # ============================================================================
     # Storyboard Operations
@@ -113,12 +328,35 @@ class FirestoreDatabase:
         Write-through cache: Firestore first, then cache.
         """
         # Write to Firestore (persistence)
-        doc_ref = self._db.collection('storyboards').document(storyboard.storyboard_id)
+        doc_ref = self._storyboards_col.document(storyboard.storyboard_id)
         doc_ref.set(self._storyboard_to_dict(storyboard))
         logger.debug(f"Saved storyboard to Firestore: {storyboard.storyboard_id}")
         
         # Write to cache (speed)
-        self._cache_storyboards[storyboard.storyboard_id] = storyboard
+        with self._lock:
+            self._cache_storyboards[storyboard.storyboard_id] = storyboard
+            self._missing_storyboards.pop(storyboard.storyboard_id, None)
+        return _remember('storyboard', storyboard.storyboard_id, storyboard)
+    
+    def create_storyboard_with_scenes(
+        self, storyboard: Storyboard, scenes: List[StoryboardScene]
+    ) -> Storyboard:
+        """Create a storyboard and its scenes in one batched commit."""
+        writes = [(self._storyboards_col.document(storyboard.storyboard_id),
+                   self._storyboard_to_dict(storyboard))]
+        writes.extend((self._scenes_col.document(scene.id), self._scene_to_dict(scene))
+                      for scene in scenes)
+        self._commit_sets(writes)
+        logger.debug(f"Saved storyboard with {len(scenes)} scenes to Firestore: {storyboard.storyboard_id}")
+        
+        with self._lock:
+            self._cache_storyboards[storyboard.storyboard_id] = storyboard
+            self._missing_storyboards.pop(storyboard.storyboard_id, None)
+            for scene in scenes:
+                self._cache_new_scene(scene)
+            self._idx_storyboard_scenes[storyboard.storyboard_id] = {scene.id for scene in scenes}
+        _remember('storyboard', storyboard.storyboard_id, storyboard)
+        self._share_scenes(scenes)
         return storyboard
     
     def get_storyboard(self, storyboard_id: str) -> Optional[Storyboard]:
@@ -127,19 +365,31 @@ class FirestoreDatabase:
         Cache-first read: Check memory, then Firestore.
         """
         # Check cache first (fast)
-        if storyboard_id in self._cache_storyboards:
-            return self._cache_storyboards[storyboard_id]
+        with self._lock:
+            storyboard = self._cache_storyboards.get(storyboard_id)
+            known_missing = storyboard_id in self._missing_storyboards
+        if storyboard is not None:
+            return _remember('storyboard', storyboard_id, storyboard)
+        # Evicted from the process cache mid-request: reuse this request's copy
+        storyboard = _recall('storyboard', storyboard_id)
+        if storyboard is not None:
+            return storyboard
+        if known_missing:
+            return None
         
         # Load from Firestore (persistent)
-        doc = self._db.collection('storyboards').document(storyboard_id).get()
+        doc = self._storyboards_col.document(storyboard_id).get()
         if doc.exists:
             data = doc.to_dict()
-            storyboard = Storyboard(**data)
+            storyboard = self._storyboard_from_dict(data)
             # Cache for next time
-            self._cache_storyboards[storyboard_id] = storyboard
+            with self._lock:
+                self._cache_storyboards[storyboard_id] = storyboard
             logger.debug(f"Loaded storyboard from Firestore: {storyboard_id}")
-            return storyboard
+            return _remember('storyboard', storyboard_id, storyboard)
         
+        with self._lock:
+            self._missing_storyboards[storyboard_id] = True
         return None
     
     def update_storyboard(self, storyboard_id: str, storyboard: Storyboard) -> Optional[Storyboard]:
@@ -147,42 +397,63 @@ class FirestoreDatabase:
         
         Returns None if storyboard doesn't exist.
         """
-        # Check if storyboard exists (cache or Firestore)
-        if storyboard_id not in self._cache_storyboards:
-            existing = self.get_storyboard(storyboard_id)
-            if not existing:
-                return None
-        
         storyboard.updated_at = datetime.utcnow()
-        
-        # Update Firestore
-        doc_ref = self._db.collection('storyboards').document(storyboard_id)
-        doc_ref.set(self._storyboard_to_dict(storyboard), merge=True)
+        data = self._storyboard_to_dict(storyboard)
+        doc_ref = self._storyboards_col.document(storyboard_id)
+        
+        # A cached entry implies the document exists; otherwise let update()
+        # check existence server-side instead of paying for a separate read
+        with self._lock:
+            cached = storyboard_id in self._cache_storyboards
+        if cached:
+            doc_ref.set(data, merge=True)
+        else:
+            from google.api_core.exceptions import NotFound
+            try:
+                doc_ref.update(data)
+            except NotFound:
+                return None
         
         # Update cache
-        self._cache_storyboards[storyboard_id] = storyboard
-        return storyboard
+        with self._lock:
+            self._cache_storyboards[storyboard_id] = storyboard
+        return _remember('storyboard', storyboard_id, storyboard)
     
     def delete_storyboard(self, storyboard_id: str) -> bool:
         """Delete storyboard and its scenes from Firestore and cache.
         
         Cascades to delete all scenes belonging to this storyboard.
         """
-        # Check if exists
-        if storyboard_id not in self._cache_storyboards and not self.get_storyboard(storyboard_id):
-            return False
+        from google.api_core.exceptions import NotFound
         
-        # Delete all scenes first
-        scenes = self.get_scenes_by_storyboard(storyboard_id)
-        for scene in scenes:
-            self.delete_scene(scene.id)
+        scene_ids = self.get_scene_ids_by_storyboard(storyboard_id)
         
-        # Delete storyboard from Firestore
-        self._db.collection('storyboards').document(storyboard_id).delete()
+        # Delete the storyboard and its scenes with batched writes, one commit
+        # per _BATCH_WRITE_LIMIT operations. The storyboard delete goes first
+        # with an exists precondition instead of a separate existence read:
+        # if it's missing, the first batch fails as a whole and nothing is deleted.
+        deletes = [(self._storyboards_col.document(storyboard_id), self._db.write_option(exists=True))]
+        deletes.extend((self._scenes_col.document(scene_id), None) for scene_id in scene_ids)
+        try:
+            for start in range(0, len(deletes), _BATCH_WRITE_LIMIT):
+                batch = self._db.batch()
+                for ref, option in deletes[start:start + _BATCH_WRITE_LIMIT]:
+                    batch.delete(ref, option=option)
+                batch.commit()
+        except NotFound:
+            # Deleted elsewhere; drop any stale cache entry
+            with self._lock:
+                self._cache_storyboards.pop(storyboard_id, None)
+            return False
         
         # Delete from cache
-        if storyboard_id in self._cache_storyboards:
-            del self._cache_storyboards[storyboard_id]
+        with self._lock:
+            for scene_id in scene_ids:
+                self._uncache_scene(scene_id)
+            self._cache_storyboards.pop(storyboard_id, None)
+            self._idx_storyboard_scenes.pop(storyboard_id, None)
+        self._unshare_scenes(scene_ids)
+        _forget('storyboard', storyboard_id)
         
         return True
     
@@ -193,76 +464,144 @@ class FirestoreDatabase:
     def create_scene(self, scene: StoryboardScene) -> StoryboardScene:
         """Create scene in Firestore and cache."""
         # Write to Firestore
-        doc_ref = self._db.collection('scenes').document(scene.id)
+        doc_ref = self._scenes_col.document(scene.id)
         doc_ref.set(self._scene_to_dict(scene))
         
         # Write to cache
-        self._cache_scenes[scene.id] = scene
+        self._cache_new_scene(scene)
+        self._share_scenes([scene])
         return scene
     
+    def create_scenes(self, scenes: List[StoryboardScene]) -> List[StoryboardScene]:
+        """Create several scenes with batched writes instead of one RPC each."""
+        self._commit_sets([(self._scenes_col.document(scene.id), self._scene_to_dict(scene))
+                           for scene in scenes])
+        for scene in scenes:
+            self._cache_new_scene(scene)
+        self._share_scenes(scenes)
+        return scenes
+    
+    def _cache_new_scene(self, scene: StoryboardScene) -> None:
+        """Cache a just-created scene and record it in the storyboard index."""
+        with self._lock:
+            self._cache_scene(scene)
+            self._missing_scenes.pop(scene.id, None)
+            scene_ids = self._idx_storyboard_scenes.get(scene.storyboard_id)
+            if scene_ids is not None:
+                scene_ids.add(scene.id)
+    
     def get_scene(self, scene_id: str) -> Optional[StoryboardScene]:
         """Get scene from cache or Firestore.
         
         Cache-first read for performance.
         """
         # Check cache first
-        if scene_id in self._cache_scenes:
-            return self._cache_scenes[scene_id]
+        with self._lock:
+            scene = self._cache_scenes.get(scene_id)
+            known_missing = scene_id in self._missing_scenes
+        if scene is not None:
+            return _remember('scene', scene_id, scene)
+        # Evicted from the process cache mid-request: reuse this request's copy
+        scene = _recall('scene', scene_id)
+        if scene is not None:
+            return scene
+        if known_missing:
+            return None
         
         # Load from Firestore
-        doc = self._db.collection('scenes').document(scene_id).get()
+        doc = self._scenes_col.document(scene_id).get()
         if doc.exists:
             data = doc.to_dict()
-            scene = StoryboardScene(**data)
+            scene = self._scene_from_dict(data)
             # Cache for next time
-            self._cache_scenes[scene_id] = scene
-            return scene
+            return self._cache_scene(scene)
         
+        with self._lock:
+            self._missing_scenes[scene_id] = True
         return None
     
     def get_scenes_by_storyboard(self, storyboard_id: str) -> List[StoryboardScene]:
         """Get all scenes for a storyboard.
         
-        Loads from Firestore to ensure completeness, caches results.
+        While the storyboard's scene-id index is warm, only scenes missing
+        from the cache are fetched, in one get_all() round-trip. Otherwise
+        queries Firestore for the full set and re-warms the index.
         """
-        # Always load from Firestore to ensure we have all scenes
+        with self._lock:
+            scene_ids = self._idx_storyboard_scenes.get(storyboard_id)
+            # Sort a snapshot taken under the lock; other threads add and
+            # discard ids in place
+            ordered_ids = sorted(scene_ids) if scene_ids is not None else None
+            scenes = {sid: self._cache_scenes.get(sid) for sid in ordered_ids or ()}
+        if ordered_ids is not None:
+            missing = [sid for sid in ordered_ids if scenes[sid] is None]
+            if missing:
+                refs = [self._scenes_col.document(sid) for sid in missing]
+                for snap in self._db.get_all(refs):
+                    if snap.exists:
+                        scenes[snap.id] = self._cache_scene(self._scene_from_dict(snap.to_dict()))
+                    else:
+                        with self._lock:
+                            scene_ids.discard(snap.id)
+            return [scenes[sid] for sid in ordered_ids if scenes[sid] is not None]
+        
+        # Cold storyboard: load from Firestore to ensure we have all scenes
         # (scenes might have been added in another process/server)
-        query = self._db.collection('scenes').where('storyboard_id', '==', storyboard_id)
-        docs = query.stream()
+        query = self._scenes_col.where('storyboard_id', '==', storyboard_id)
+        docs = list(query.stream())
         
+        # Build only the uncached docs; cached scenes are reused as-is
         scenes = []
-        for doc in docs:
-            # Check cache first to avoid re-parsing
-            if doc.id in self._cache_scenes:
-                scenes.append(self._cache_scenes[doc.id])
-            else:
-                data = doc.to_dict()
-                scene = StoryboardScene(**data)
-                self._cache_scenes[scene.id] = scene
+        with self._lock:
+            for doc in docs:
+                scene = self._cache_scenes.get(doc.id)
+                if scene is None:
+                    scene = self._cache_scene(self._scene_from_dict(doc.to_dict()))
                 scenes.append(scene)
+            self._idx_storyboard_scenes[storyboard_id] = {doc.id for doc in docs}
         
         return scenes
     
+    def get_scene_ids_by_storyboard(self, storyboard_id: str) -> List[str]:
+        """Get the IDs of all scenes for a storyboard.
+        
+        Projects the query down to the ``id`` field so only document
+        names come back over the single streaming RPC, and nothing is
+        parsed into models. Served by Firestore's automatic single-field
+        index on ``storyboard_id``.
+        """
+        query = (self._scenes_col
+                 .where('storyboard_id', '==', storyboard_id)
+                 .select(['id']))
+        return [doc.id for doc in query.stream()]
+    
     def get_scene_by_image_prediction_id(self, prediction_id: str) -> Optional[StoryboardScene]:
         """Get scene by Replicate image prediction ID.
         
         Used by webhook handler to find scene when image generation completes.
         """
-        # Check cache first for performance
-        for scene in self._cache_scenes.values():
-            if scene.replicate_image_prediction_id == prediction_id:
-                return scene
+        # Single view probe; verify since the scene may have moved on
+        with self._lock:
+            scene = self._idx_image_pred.get(prediction_id)
+        if scene is not None and scene.replicate_image_prediction_id == prediction_id:
+            return scene
+        
+        # Another worker may have created/updated the scene
+        scene = self._shared_scene_by_prediction(
+            'pred_img', 'replicate_image_prediction_id', prediction_id
+        )
+        if scene:
+            return scene
         
         # Query Firestore if not in cache
-        query = self._db.collection('scenes').where('replicate_image_prediction_id', '==', prediction_id).limit(1)
+        query = self._scenes_col.where('replicate_image_prediction_id', '==', prediction_id).limit(1)
         docs = list(query.stream())
         
         if docs:
             data = docs[0].to_dict()
-            scene = StoryboardScene(**data)
+            scene = self._scene_from_dict(data)
             # Cache for next time
-            self._cache_scenes[scene.id] = scene
-            return scene
+            return self._cache_scene(scene)
         
         return None
     
@@ -271,21 +610,28 @@ class FirestoreDatabase:
         
         Used by webhook handler to find scene when video generation completes.
         """
-        # Check cache first for performance
-        for scene in self._cache_scenes.values():
-            if scene.replicate_video_prediction_id == prediction_id:
-                return scene
+        # Single view probe; verify since the scene may have moved on
+        with self._lock:
+            scene = self._idx_video_pred.get(prediction_id)
+        if scene is not None and scene.replicate_video_prediction_id == prediction_id:
+            return scene
+        
+        # Another worker may have created/updated the scene
+        scene = self._shared_scene_by_prediction(
+            'pred_vid', 'replicate_video_prediction_id', prediction_id
+        )
+        if scene:
+            return scene
         
         # Query Firestore if not in cache
-        query = self._db.collection('scenes').where('replicate_video_prediction_id', '==', prediction_id).limit(1)
+        query = self._scenes_col.where('replicate_video_prediction_id', '==', prediction_id).limit(1)
         docs = list(query.stream())
         
         if docs:
             data = docs[0].to_dict()
-            scene = StoryboardScene(**data)
+            scene = self._scene_from_dict(data)
             # Cache for next time
-            self._cache_scenes[scene.id] = scene
-            return scene
+            return self._cache_scene(scene)
         
         return None
     
@@ -294,37 +640,78 @@ class FirestoreDatabase:
         
         Returns None if scene doesn't exist.
         """
-        # Check if scene exists (cache or Firestore)
-        if scene_id not in self._cache_scenes:
-            existing = self.get_scene(scene_id)
-            if not existing:
-                return None
-        
         scene.updated_at = datetime.utcnow()
-        
-        # Update Firestore
-        doc_ref = self._db.collection('scenes').document(scene_id)
-        doc_ref.set(self._scene_to_dict(scene), merge=True)
+        data = self._scene_to_dict(scene)
+        doc_ref = self._scenes_col.document(scene_id)
+        
+        # A cached entry implies the document exists; otherwise let update()
+        # check existence server-side instead of paying for a separate read
+        with self._lock:
+            cached = scene_id in self._cache_scenes
+        if cached:
+            doc_ref.set(data, merge=True)
+        else:
+            from google.api_core.exceptions import NotFound
+            try:
+                doc_ref.update(data)
+            except NotFound:
+                return None
         
         # Update cache
-        self._cache_scenes[scene_id] = scene
+        self._cache_scene(scene)
+        self._share_scenes([scene])
         return scene
     
     def delete_scene(self, scene_id: str) -> bool:
         """Delete scene from Firestore and cache."""
-        # Check if exists
-        if scene_id not in self._cache_scenes and not self.get_scene(scene_id):
-            return False
+        from google.api_core.exceptions import NotFound
         
-        # Delete from Firestore
-        self._db.collection('scenes').document(scene_id).delete()
+        # Delete from Firestore; the exists precondition makes the delete
+        # itself report a missing scene, so no existence read is needed
+        try:
+            self._scenes_col.document(scene_id).delete(option=self._db.write_option(exists=True))
+        except NotFound:
+            # Deleted elsewhere; drop any stale cache entry
+            self._uncache_scene(scene_id)
+            return False
         
         # Delete from cache
-        if scene_id in self._cache_scenes:
-            del self._cache_scenes[scene_id]
+        self._uncache_scene(scene_id)
+        self._unshare_scenes([scene_id])
         
         return True
 
+    # ============================================================================
+    # Async Wrappers
+    # ============================================================================
+    # The Firestore client is blocking; these run the sync methods in a worker
+    # thread so async handlers (SSE polling, webhooks) don't stall the event
+    # loop. They share the same cache as the sync methods.
+
+    async def get_storyboard_async(self, storyboard_id: str) -> Optional[Storyboard]:
+        """Async variant of get_storyboard."""
+        return await asyncio.to_thread(self.get_storyboard, storyboard_id)
+
+    async def get_scene_async(self, scene_id: str) -> Optional[StoryboardScene]:
+        """Async variant of get_scene."""
+        return await asyncio.to_thread(self.get_scene, scene_id)
+
+    async def get_scenes_by_storyboard_async(self, storyboard_id: str) -> List[StoryboardScene]:
+        """Async variant of get_scenes_by_storyboard."""
+        return await asyncio.to_thread(self.get_scenes_by_storyboard, storyboard_id)
+
+    async def get_scene_by_image_prediction_id_async(self, prediction_id: str) -> Optional[StoryboardScene]:
+        """Async variant of get_scene_by_image_prediction_id."""
+        return await asyncio.to_thread(self.get_scene_by_image_prediction_id, prediction_id)
+
+    async def get_scene_by_video_prediction_id_async(self, prediction_id: str) -> Optional[StoryboardScene]:
+        """Async variant of get_scene_by_video_prediction_id."""
+        return await asyncio.to_thread(self.get_scene_by_video_prediction_id, prediction_id)
+
+    async def update_scene_async(self, scene_id: str, scene: StoryboardScene) -> Optional[StoryboardScene]:
+        """Async variant of update_scene."""
+        return await asyncio.to_thread(self.update_scene, scene_id, scene)
+
     # ============================================================================
     # Asset Operations (Firestore + Cache)
     # ============================================================================
@@ -345,8 +732,10 @@ class FirestoreDatabase:
         logger.debug(f"Saved asset to Firestore: {asset_id} for user {user_id}")
         
         # Write to cache (speed)
-        self._cache_assets[asset_id] = asset_data
-        return asset_data
+        with self._lock:
+            self._cache_assets[asset_id] = asset_data
+            self._idx_asset_user[asset_id] = user_id
+        return _remember('asset', asset_id, asset_data)
 
     def get_asset(self, asset_id: str) -> Optional[Dict]:
         """Get asset from cache or Firestore.
@@ -356,30 +745,92 @@ class FirestoreDatabase:
         For user-specific queries, use list_assets_by_type with user filtering.
         """
         # Check cache first (fast)
-        if asset_id in self._cache_assets:
-            return self._cache_assets[asset_id]
-        
-        # Need to search across users since we don't know which user owns this asset
-        # This is inefficient but necessary for backward compatibility
-        # TODO: Consider requiring user_id parameter in future version
+        with self._lock:
+            asset = self._cache_assets.get(asset_id)
+            user_id = self._idx_asset_user.get(asset_id)
+        if asset is not None:
+            return _remember('asset', asset_id, asset)
+        # Evicted from the process cache mid-request: reuse this request's copy
+        asset = _recall('asset', asset_id)
+        if asset is not None:
+            return asset
         
-        # Query Firestore across all users (expensive but necessary)
-        # We use collection group query to search all assets collections
         try:
+            # Known owner: direct document read instead of a cross-user scan
+            if user_id:
+                doc = (self._db.collection('users').document(user_id)
+                       .collection('assets').document(asset_id).get())
+                if doc.exists:
+                    data = self._intern_ids(doc.to_dict(), 'asset_id', 'user_id')
+                    with self._lock:
+                        self._cache_assets[asset_id] = data
+                    logger.debug(f"Loaded asset from Firestore: {asset_id}")
+                    return _remember('asset', asset_id, data)
+            
+            # Need to search across users since we don't know which user owns this asset
+            # This is inefficient but necessary for backward compatibility
+            # TODO: Consider requiring user_id parameter in future version
+            
+            # Query Firestore across all users (expensive but necessary)
+            # We use collection group query to search all assets collections
             query = self._db.collection_group('assets').where('asset_id', '==', asset_id).limit(1)
             docs = list(query.stream())
             
             if docs:
-                data = docs[0].to_dict()
+                data = self._intern_ids(docs[0].to_dict(), 'asset_id', 'user_id')
                 # Cache for next time
-                self._cache_assets[asset_id] = data
+                with self._lock:
+                    self._cache_assets[asset_id] = data
+                    if data.get('user_id'):
+                        self._idx_asset_user[asset_id] = data['user_id']
                 logger.debug(f"Loaded asset from Firestore: {asset_id}")
-                return data
+                return _remember('asset', asset_id, data)
         except Exception as e:
             logger.error(f"Error querying Firestore for asset {asset_id}: {e}")
         
         return None
 
+    def iter_assets_by_type(self, asset_type: str, user_id: Optional[str] = None,
+                            page_size: int = _ASSET_PAGE_SIZE) -> Iterator[Dict]:
+        """Yield assets of a specific type from Firestore, one page at a time.
+        
+        If user_id is provided, queries that user's assets subcollection
+        directly; otherwise uses a collection group query across all users
+        (needs a collection-group index on assets.asset_type). Pages are
+        cursored with start_after(), so callers that stop early never pull
+        the rest of the collection.
+        """
+        from google.cloud.firestore_v1.base_query import FieldFilter
+        
+        if user_id:
+            # Efficient: Query specific user's assets
+            query = self._db.collection('users').document(user_id).collection('assets')
+        else:
+            # Less efficient: Search across all users using collection group query
+            query = self._db.collection_group('assets')
+        query = (query.where(filter=FieldFilter('asset_type', '==', asset_type))
+                 .order_by('__name__')
+                 .limit(page_size))
+        
+        last_doc = None
+        while True:
+            page = query.start_after(last_doc) if last_doc is not None else query
+            docs = list(page.stream())
+            for doc in docs:
+                # Check cache first to avoid re-parsing
+                with self._lock:
+                    data = self._cache_assets.get(doc.id)
+                if data is None:
+                    data = self._intern_ids(doc.to_dict(), 'asset_id', 'user_id')
+                    with self._lock:
+                        self._cache_assets[doc.id] = data
+                        if data.get('user_id'):
+                            self._idx_asset_user[doc.id] = data['user_id']
+                yield data
+            if len(docs) < page_size:
+                return
+            last_doc = docs[-1]
+
     def list_assets_by_type(self, asset_type: str, user_id: Optional[str] = None) -> List[Dict]:
         """List all assets of a specific type from Firestore.
         
@@ -388,49 +839,19 @@ class FirestoreDatabase:
         
         Always loads from Firestore to ensure completeness.
         """
-        assets = []
-        
         try:
+            assets = list(self.iter_assets_by_type(asset_type, user_id))
             if user_id:
-                # Efficient: Query specific user's assets
-                query = (self._db.collection('users').document(user_id)
-                        .collection('assets')
-                        .where('asset_type', '==', asset_type))
-                docs = query.stream()
-                
-                for doc in docs:
-                    # Check cache first to avoid re-parsing
-                    if doc.id in self._cache_assets:
-                        assets.append(self._cache_assets[doc.id])
-                    else:
-                        data = doc.to_dict()
-                        self._cache_assets[doc.id] = data
-                        assets.append(data)
-                
                 logger.debug(f"Loaded {len(assets)} assets of type {asset_type} for user {user_id}")
             else:
-                # Less efficient: Search across all users using collection group query
-                query = self._db.collection_group('assets').where('asset_type', '==', asset_type)
-                docs = query.stream()
-                
-                for doc in docs:
-                    # Check cache first to avoid re-parsing
-                    if doc.id in self._cache_assets:
-                        assets.append(self._cache_assets[doc.id])
-                    else:
-                        data = doc.to_dict()
-                        self._cache_assets[doc.id] = data
-                        assets.append(data)
-                
                 logger.debug(f"Loaded {len(assets)} assets of type {asset_type} across all users")
         
         except Exception as e:
             logger.error(f"Error loading assets from Firestore: {e}")
             # Fallback to cache only
-            assets = [
-                asset for asset in self._cache_assets.values()
-                if asset.get('asset_type') == asset_type
-            ]
+            with self._lock:
+                cached = list(self._cache_assets.values())
+            assets = [asset for asset in cached if asset.get('asset_type') == asset_type]
             if user_id:
                 assets = [asset for asset in assets if asset.get('user_id') == user_id]
         
@@ -452,8 +873,9 @@ class FirestoreDatabase:
         if not user_id:
             logger.warning(f"Asset {asset_id} has no user_id, cannot delete from Firestore")
             # Still delete from cache
-            if asset_id in self._cache_assets:
-                del self._cache_assets[asset_id]
+            with self._lock:
+                self._cache_assets.pop(asset_id, None)
+            _forget('asset', asset_id)
             return True
         
         try:
@@ -466,12 +888,27 @@ class FirestoreDatabase:
             # Continue to delete from cache anyway
         
         # Delete from cache
-        if asset_id in self._cache_assets:
-            del self._cache_assets[asset_id]
+        with self._lock:
+            self._cache_assets.pop(asset_id, None)
+            self._idx_asset_user.pop(asset_id, None)
+        _forget('asset', asset_id)
         
         return True
 
 
-# Global database instance
-db = FirestoreDatabase()
+@lru_cache(maxsize=1)
+def get_db() -> FirestoreDatabase:
+    """Get the global database instance, connecting to Firestore on first call."""
+    return FirestoreDatabase()
+
+
+def __getattr__(name: str):
+    """Create the global ``db`` instance lazily on first access.
+
+    ``from app.firestore_database import db`` keeps working, but importing
+    this module alone no longer initializes Firebase.
+    """
+    if name == "db":
+        return get_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -1,9 +1,12 @@
 """FastAPI application entry point."""
+import importlib
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
-from app.routers import moods, scenes, video, audio, composition, storyboards, product, admin, brand, character, backgrounds, whisper, webhooks
+from app.middleware.json_gzip import JSONGZipMiddleware
+from app.middleware.request_cache import RequestCacheMiddleware
 
 # Configure logging
 logging.basicConfig(
@@ -11,11 +14,30 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+logger = logging.getLogger(__name__)
+
+# warm_up() hooks of the included routers, run once at startup
+_warm_ups = []
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build router singletons before serving, so no request pays for it."""
+    for warm_up in _warm_ups:
+        try:
+            warm_up()
+        except Exception as e:
+            # Not fatal: the router's factory retries (and reports) on first use
+            logger.warning(f"Warm-up failed for {warm_up.__module__}: {e}")
+    yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title="AI Video Generation Pipeline API",
     description="Backend API for AI-powered video generation pipeline",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # CORS Configuration
@@ -27,21 +49,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request Firestore read cache
+app.add_middleware(RequestCacheMiddleware)
+
+# Compress JSON responses only; image/video files and the self-compressing
+# SSE stream pass through
+app.add_middleware(JSONGZipMiddleware, minimum_size=500)
+
+
+# Routers under app/routers, in registration order. Modules listed in
+# DISABLED_ROUTERS are never imported, so a worker only pays for what it serves.
+ROUTERS = (
+    "webhooks",  # Webhooks for Replicate callbacks (must be registered first for proper routing)
+    "storyboards",  # Unified Storyboard Interface
+    "moods",
+    "scenes",
+    "video",
+    "audio",
+    "composition",
+    "product",
+    "brand",
+    "character",
+    "backgrounds",
+    "whisper",  # Whisper speech-to-text
+    "admin",  # Admin metrics and monitoring
+)
 
-# Include routers
-app.include_router(webhooks.router)  # Webhooks for Replicate callbacks (must be registered first for proper routing)
-app.include_router(storyboards.router)  # Unified Storyboard Interface
-app.include_router(moods.router)
-app.include_router(scenes.router)
-app.include_router(video.router)
-app.include_router(audio.router)
-app.include_router(composition.router)
-app.include_router(product.router)
-app.include_router(brand.router)
-app.include_router(character.router)
-app.include_router(backgrounds.router)
-app.include_router(whisper.router)  # Whisper speech-to-text
-app.include_router(admin.router)  # Admin metrics and monitoring
+# Include routers; a router with expensive services may define warm_up()
+_disabled_routers = settings.get_disabled_routers()
+for _module_name in ROUTERS:
+    if _module_name in _disabled_routers:
+        logger.info(f"Router disabled: {_module_name}")
+        continue
+    _module = importlib.import_module(f"app.routers.{_module_name}")
+    app.include_router(_module.router)
+    if hasattr(_module, "warm_up"):
+        _warm_ups.append(_module.warm_up)
 
 
 @app.get("/")
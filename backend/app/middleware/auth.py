@@ -5,10 +5,13 @@ Provides token verification for protecting backend routes.
 Uses Firebase Admin SDK to verify ID tokens from client.
 """
 from typing import Optional
+import hashlib
+import time
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-import firebase_admin
 from firebase_admin import auth as firebase_auth
+from app.firebase_init import get_firebase_app
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,45 +19,31 @@ logger = logging.getLogger(__name__)
 # HTTP Bearer token security scheme
 security = HTTPBearer()
 
-# Global Firebase Admin app instance (may already be initialized by firebase_storage_service)
-_firebase_admin_initialized = False
+# Verified tokens: blake2b(token) -> (uid, exp). The TTL is well under the 1h
+# Firebase token lifetime, and entries close to expiry are re-verified.
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_TOKEN_EXPIRY_MARGIN_SECONDS = 30
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Hash the raw token so the cache never holds bearer credentials."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
 
 
 def _ensure_firebase_admin():
     """
     Ensure Firebase Admin SDK is initialized.
-    This may already be done by firebase_storage_service.
+    Shares the single per-process app with Firestore and Storage.
     """
-    global _firebase_admin_initialized
-    
-    # Check if Firebase Admin is already initialized
     try:
-        firebase_admin.get_app()
-        _firebase_admin_initialized = True
+        get_firebase_app()
         return True
-    except ValueError:
-        # Not initialized yet, try to initialize
-        try:
-            from firebase_admin import credentials
-            import os
-            from pathlib import Path
-            
-            # Look for service account key
-            creds_path = Path(__file__).parent.parent.parent / "serviceAccountKey.json"
-            
-            if not creds_path.exists():
-                logger.warning(f"Firebase credentials file not found at {creds_path}")
-                return False
-            
-            cred = credentials.Certificate(str(creds_path))
-            firebase_admin.initialize_app(cred)
-            _firebase_admin_initialized = True
-            logger.info("Firebase Admin SDK initialized for authentication")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error initializing Firebase Admin SDK: {e}", exc_info=True)
-            return False
+    except FileNotFoundError as e:
+        logger.warning(str(e))
+        return False
+    except Exception as e:
+        logger.error(f"Error initializing Firebase Admin SDK: {e}", exc_info=True)
+        return False
 
 
 async def get_current_user(
@@ -81,18 +70,25 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or verification fails
     """
+    token = credentials.credentials
+    
+    # Recently verified token: skip signature verification
+    cache_key = _token_cache_key(token)
+    cached = _TOKEN_CACHE.get(cache_key)
+    if cached and cached[1] > time.time() + _TOKEN_EXPIRY_MARGIN_SECONDS:
+        return cached[0]
+    
     if not _ensure_firebase_admin():
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Authentication service not available",
         )
     
-    token = credentials.credentials
-    
     try:
         # Verify the ID token
         decoded_token = firebase_auth.verify_id_token(token)
         user_id = decoded_token['uid']
+        _TOKEN_CACHE[cache_key] = (user_id, decoded_token['exp'])
         
         logger.debug(f"Successfully authenticated user: {user_id}")
         return user_id
@@ -0,0 +1,72 @@
+"""
+JSON Gzip Middleware
+
+Gzips JSON API responses only. Images and videos served with FileResponse
+are already compressed and rely on Range/ETag, and the SSE endpoint
+compresses its own stream, so everything that isn't a single-body JSON
+response passes through untouched.
+"""
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class JSONGZipMiddleware:
+    """Gzip complete ``application/json`` response bodies.
+
+    Plain ASGI middleware (not BaseHTTPMiddleware) so streaming responses
+    pass through without extra buffering. Range requests and clients that
+    don't accept gzip are never compressed.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, compresslevel: int = 6):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        if "gzip" not in request_headers.get("accept-encoding", "") or "range" in request_headers:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message = {}
+        passthrough = False
+
+        async def send_maybe_gzipped(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (not headers.get("content-type", "").startswith("application/json")
+                        or "content-encoding" in headers):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # Held until the body shows whether it is worth compressing
+                    start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            # Streamed JSON is rare here; send it as-is rather than buffer it
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            body = gzip.compress(body, compresslevel=self.compresslevel)
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["Content-Encoding"] = "gzip"
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_maybe_gzipped)
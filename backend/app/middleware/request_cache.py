@@ -0,0 +1,32 @@
+"""
+Request-Scoped Firestore Cache Middleware
+
+Gives every HTTP request its own small cache of the storyboards, scenes and
+assets it has read or written, so items evicted from the process-wide LRU
+mid-request are not fetched from Firestore a second time.
+"""
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.firestore_database import request_cache
+
+
+class RequestCacheMiddleware:
+    """Install a fresh request-scoped cache for each HTTP request.
+
+    Plain ASGI middleware (not BaseHTTPMiddleware) so streaming responses
+    such as the SSE endpoint pass through without extra buffering.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_cache.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_cache.reset(token)
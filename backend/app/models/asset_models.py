@@ -3,14 +3,23 @@ Shared Pydantic Models for Asset Upload
 """
 
 from pydantic import BaseModel, Field
-from typing import Literal, Dict, Any, Optional
+from app.models.base import ResponseModel
+from typing import Literal, Optional
+
+ImageFormat = Literal["png", "jpg"]
 
 class ImageDimensions(BaseModel):
     """Image dimensions."""
     width: int = Field(..., description="Image width in pixels")
     height: int = Field(..., description="Image height in pixels")
 
-class AssetUploadResponse(BaseModel):
+class AssetMetadata(BaseModel):
+    """Upload details attached to an asset status."""
+    filename: str = Field(..., description="Original filename")
+    size: int = Field(..., description="File size in bytes")
+    uploaded_at: str = Field(..., description="ISO timestamp")
+
+class AssetUploadResponse(ResponseModel):
     """Generic response from asset upload."""
     asset_id: str = Field(..., description="UUID for asset")
     filename: str = Field(..., description="Original filename")
@@ -20,11 +29,11 @@ class AssetUploadResponse(BaseModel):
     public_thumbnail_url: Optional[str] = Field(None, description="Public thumbnail URL from Firebase Storage")
     size: int = Field(..., description="File size in bytes")
     dimensions: ImageDimensions = Field(..., description="Image dimensions")
-    format: str = Field(..., description="png or jpg")
+    format: ImageFormat = Field(..., description="png or jpg")
     has_alpha: bool = Field(..., description="Whether image has alpha channel")
     uploaded_at: str = Field(..., description="ISO timestamp")
 
-class AssetStatus(BaseModel):
+class AssetStatus(ResponseModel):
     """Generic status of uploaded asset."""
     asset_id: str
     status: Literal["active", "deleted"]
@@ -33,8 +42,8 @@ class AssetStatus(BaseModel):
     public_url: Optional[str] = None  # Public URL from Firebase Storage
     public_thumbnail_url: Optional[str] = None  # Public thumbnail URL from Firebase Storage
     dimensions: ImageDimensions
-    format: str
+    format: ImageFormat
     has_alpha: bool
-    metadata: Dict[str, Any]
+    metadata: AssetMetadata
 
 
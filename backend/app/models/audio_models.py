@@ -1,20 +1,23 @@
 """Pydantic models for audio generation API."""
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from typing import Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
+from app.models.base import ResponseModel
 
 
 class AudioGenerationRequest(BaseModel):
     """Request model for audio generation from mood data."""
+    model_config = ConfigDict(frozen=True)
+
     mood_name: str = Field(..., description="Name of the mood (e.g., 'Energetic', 'Calm')")
     mood_description: str = Field(..., description="Detailed description of the mood")
-    emotional_tone: List[str] = Field(..., description="List of emotional tones from creative brief")
+    emotional_tone: Tuple[str, ...] = Field(..., description="List of emotional tones from creative brief")
     aesthetic_direction: str = Field(..., description="Overall aesthetic direction")
-    style_keywords: Optional[List[str]] = Field(default=None, description="Optional list of visual style keywords")
+    style_keywords: Optional[Tuple[str, ...]] = Field(default=None, description="Optional list of visual style keywords")
     duration: int = Field(default=30, ge=1, description="Duration in seconds (default: 30)")
     custom_prompt: Optional[str] = Field(default=None, description="Optional custom prompt to use instead of building from fields")
 
 
-class AudioGenerationResponse(BaseModel):
+class AudioGenerationResponse(ResponseModel):
     """Response model for audio generation."""
     success: bool = Field(..., description="Whether generation was successful")
     audio_url: Optional[str] = Field(None, description="URL of the generated audio file")
@@ -23,14 +26,23 @@ class AudioGenerationResponse(BaseModel):
     error: Optional[str] = Field(None, description="Error message if generation failed")
 
 
+class MoodAudioBrief(BaseModel):
+    """Creative brief and mood context sent with a mood audio request."""
+    emotional_tone: Tuple[str, ...] = Field(default=(), description="List of emotional tones from creative brief")
+    mood_name: str = Field(default="Unknown Mood", description="Name of the selected mood")
+    mood_description: str = Field(default="", description="Description of the selected mood")
+    aesthetic_direction: str = Field(default="", description="Overall aesthetic direction")
+    style_keywords: Tuple[str, ...] = Field(default=(), description="Visual style keywords")
+
+
 class MoodAudioRequest(BaseModel):
     """Request model for generating audio for a selected mood."""
     mood_id: str = Field(..., description="Unique identifier of the selected mood")
-    creative_brief: dict = Field(..., description="Creative brief data containing emotional tone and other context")
+    creative_brief: MoodAudioBrief = Field(..., description="Creative brief data containing emotional tone and other context")
     duration: int = Field(default=30, ge=1, description="Duration in seconds (default: 30)")
 
 
-class AudioGenerationError(BaseModel):
+class AudioGenerationError(ResponseModel):
     """Error response model."""
     success: bool = Field(False, description="Always false for errors")
     error: str = Field(..., description="Error message")
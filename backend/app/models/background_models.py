@@ -3,27 +3,49 @@ Pydantic Models for Background Asset Upload and Generation
 """
 
 from ..models.asset_models import AssetUploadResponse, AssetStatus
-from typing import List, Optional
+from ..models.mood_models import CreativeBriefInput
+from typing import List, Literal, Optional, Tuple
 from pydantic import BaseModel, Field
+from app.models.base import ResponseModel
 
 # Background assets use the generic asset models
 BackgroundAssetUploadResponse = AssetUploadResponse
 BackgroundAssetStatus = AssetStatus
 
 
-class BackgroundGenerationRequest(BaseModel):
+class BackgroundGenerationRequest(CreativeBriefInput):
     """Request model for generating background images from creative brief."""
-    product_name: str = Field(..., description="Name of the product")
-    target_audience: str = Field(..., description="Target audience description")
-    emotional_tone: List[str] = Field(default_factory=list, description="List of emotional tones")
-    visual_style_keywords: List[str] = Field(default_factory=list, description="List of visual style keywords")
-    key_messages: List[str] = Field(default_factory=list, description="List of key messages")
+    # The list fields are optional here, unlike in CreativeBriefInput
+    emotional_tone: Tuple[str, ...] = Field(default=(), description="List of emotional tones")
+    visual_style_keywords: Tuple[str, ...] = Field(default=(), description="List of visual style keywords")
+    key_messages: Tuple[str, ...] = Field(default=(), description="List of key messages")
     user_id: Optional[str] = Field(None, description="User ID for asset ownership")
 
 
-class BackgroundGenerationResponse(BaseModel):
+class BackgroundGenerationResponse(ResponseModel):
     """Response model for background generation."""
     success: bool = Field(..., description="Whether generation was successful")
     backgrounds: List[BackgroundAssetStatus] = Field(..., description="List of generated background assets")
     message: Optional[str] = Field(None, description="Optional message about the generation")
 
+
+BackgroundJobState = Literal["pending", "processing", "completed", "failed"]
+
+
+class BackgroundGenerationJobResponse(ResponseModel):
+    """Response model for starting a background generation job."""
+    success: bool = Field(..., description="Whether the job was accepted")
+    job_id: str = Field(..., description="Job ID to poll for status")
+    message: Optional[str] = Field(None, description="Optional message about the job")
+
+
+class BackgroundGenerationJobStatus(BaseModel):
+    """Status of a background generation job, updated as it runs."""
+    job_id: str = Field(..., description="Unique job identifier")
+    status: BackgroundJobState = Field(..., description="Current job status")
+    backgrounds: List[BackgroundAssetStatus] = Field(default_factory=list, description="Generated background assets, once completed")
+    message: Optional[str] = Field(None, description="Summary of the generation, once completed")
+    error: Optional[str] = Field(None, description="Error message if the job failed")
+    error_status: Optional[int] = Field(
+        None, description="HTTP status matching the failure: 400 for an invalid brief, 500 for generation errors"
+    )
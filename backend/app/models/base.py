@@ -0,0 +1,8 @@
+"""Shared base classes for the API's Pydantic models."""
+from pydantic import BaseModel, ConfigDict
+
+
+class ResponseModel(BaseModel):
+    """Base for response bodies: unknown fields are rejected and instances
+    are immutable once built."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
@@ -1,6 +1,8 @@
 """Pydantic models for video composition."""
+from dataclasses import dataclass
 from typing import List, Optional
 from pydantic import BaseModel, Field
+from app.models.base import ResponseModel
 from enum import Enum
 
 
@@ -32,7 +34,7 @@ class CompositionRequest(BaseModel):
     target_size_mb: float = Field(50.0, description="Target file size in MB", gt=0, le=100)
 
 
-class CompositionResponse(BaseModel):
+class CompositionResponse(ResponseModel):
     """Response model for composition initiation."""
     success: bool = Field(..., description="Whether job was successfully initiated")
     job_id: str = Field(..., description="Unique job ID for tracking progress")
@@ -40,6 +42,30 @@ class CompositionResponse(BaseModel):
     total_clips: int = Field(..., description="Total number of clips to compose")
 
 
+@dataclass(slots=True)
+class CompositionJobState:
+    """
+    Composition job record, kept in the CompositionJobStore and updated
+    by the background worker.
+
+    Mirrors CompositionJobStatus field for field; it is only converted to
+    the pydantic model when a status is served.
+    """
+    job_id: str
+    status: CompositionStatus
+    total_clips: int
+    created_at: int
+    updated_at: int
+    progress_percent: int = 0
+    current_step: Optional[str] = None
+    video_url: Optional[str] = None
+    file_path: Optional[str] = None
+    file_host: Optional[str] = None
+    file_size_mb: Optional[float] = None
+    duration_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
 class CompositionJobStatus(BaseModel):
     """Model for composition job status."""
     job_id: str = Field(..., description="Unique job ID")
@@ -49,14 +75,15 @@ class CompositionJobStatus(BaseModel):
     current_step: Optional[str] = Field(None, description="Current processing step")
     video_url: Optional[str] = Field(None, description="URL of the final composed video")
     file_path: Optional[str] = Field(None, description="Local file path of the composed video")
+    file_host: Optional[str] = Field(None, description="Host whose filesystem file_path refers to")
     file_size_mb: Optional[float] = Field(None, description="Size of final video in MB")
     duration_seconds: Optional[float] = Field(None, description="Duration of final video in seconds")
     error: Optional[str] = Field(None, description="Error message if job failed")
-    created_at: str = Field(..., description="Job creation timestamp (ISO format)")
-    updated_at: str = Field(..., description="Last update timestamp (ISO format)")
+    created_at: int = Field(..., description="Job creation timestamp (epoch milliseconds)")
+    updated_at: int = Field(..., description="Last update timestamp (epoch milliseconds)")
 
 
-class CompositionJobStatusResponse(BaseModel):
+class CompositionJobStatusResponse(ResponseModel):
     """Response model for composition job status polling."""
     success: bool = Field(..., description="Whether status retrieval was successful")
     job_status: Optional[CompositionJobStatus] = Field(None, description="Current job status")
@@ -70,7 +97,7 @@ class RenderVideoRequest(BaseModel):
     target_size_mb: float = Field(50.0, description="Target file size in MB", gt=0, le=100)
 
 
-class RenderVideoResponse(BaseModel):
+class RenderVideoResponse(ResponseModel):
     """Response model for video rendering."""
     success: bool = Field(..., description="Whether rendering was successful")
     video_url: str = Field(..., description="URL of the rendered video")
@@ -1,6 +1,13 @@
 """Pydantic models for scene planning and generation."""
-from typing import List, Optional
+import math
+from typing import List, Optional, Tuple
 from pydantic import BaseModel, Field, field_validator
+from app.models.base import ResponseModel
+from app.models.mood_models import CreativeBriefInput
+
+# Accepted range for a scene plan's total duration, in seconds
+_MIN_TOTAL_DURATION = 29.0
+_MAX_TOTAL_DURATION = 31.0
 
 
 class Scene(BaseModel):
@@ -20,7 +27,7 @@ class ScenePlan(BaseModel):
     @classmethod
     def validate_duration(cls, v: float) -> float:
         """Ensure total duration is approximately 30 seconds."""
-        if not (29.0 <= v <= 31.0):
+        if not (_MIN_TOTAL_DURATION <= v <= _MAX_TOTAL_DURATION):
             raise ValueError(f"Total duration must be approximately 30 seconds, got {v}")
         return v
 
@@ -28,37 +35,30 @@ class ScenePlan(BaseModel):
     @classmethod
     def validate_scenes_duration(cls, v: List[Scene]) -> List[Scene]:
         """Ensure scene durations sum to total_duration."""
-        total = sum(scene.duration for scene in v)
-        if not (29.0 <= total <= 31.0):
+        total = math.fsum(scene.duration for scene in v)
+        if not (_MIN_TOTAL_DURATION <= total <= _MAX_TOTAL_DURATION):
             raise ValueError(f"Sum of scene durations must equal approximately 30 seconds, got {total}")
         return v
 
 
-class ScenePlanRequest(BaseModel):
+class ScenePlanRequest(CreativeBriefInput):
     """Request model for scene plan generation."""
-    # Creative brief fields
-    product_name: str = Field(..., description="Name of the product")
-    target_audience: str = Field(..., description="Target audience description")
-    emotional_tone: List[str] = Field(..., description="List of emotional tones")
-    visual_style_keywords: List[str] = Field(..., description="List of visual style keywords")
-    key_messages: List[str] = Field(..., description="List of key messages")
-
     # Selected mood data
     mood_id: str = Field(..., description="Selected mood ID")
     mood_name: str = Field(..., description="Selected mood name")
-    mood_style_keywords: List[str] = Field(..., description="Style keywords from selected mood")
-    mood_color_palette: List[str] = Field(..., description="Color palette from selected mood")
+    mood_style_keywords: Tuple[str, ...] = Field(..., description="Style keywords from selected mood")
+    mood_color_palette: Tuple[str, ...] = Field(..., description="Color palette from selected mood")
     mood_aesthetic_direction: str = Field(..., description="Aesthetic direction from selected mood")
 
 
-class ScenePlanResponse(BaseModel):
+class ScenePlanResponse(ResponseModel):
     """Response model for scene plan generation."""
     success: bool = Field(..., description="Whether generation was successful")
     scene_plan: Optional[ScenePlan] = Field(None, description="Generated scene plan")
     message: Optional[str] = Field(None, description="Optional message about the generation")
 
 
-class ScenePlanError(BaseModel):
+class ScenePlanError(ResponseModel):
     """Error response model for scene planning."""
     success: bool = Field(False, description="Always false for errors")
     error: str = Field(..., description="Error message")
@@ -86,7 +86,7 @@ class SeedImageRequest(BaseModel):
     mood_aesthetic_direction: str = Field(..., description="Aesthetic direction from selected mood")
 
 
-class SeedImageResponse(BaseModel):
+class SeedImageResponse(ResponseModel):
     """Response model for seed image generation."""
     success: bool = Field(..., description="Whether generation was successful")
     scenes_with_images: List[SceneWithSeedImage] = Field(..., description="Scenes with generated seed images")
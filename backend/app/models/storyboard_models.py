@@ -1,9 +1,10 @@
 """Pydantic models for the Unified Storyboard Interface."""
 from typing import List, Optional, Literal
 from pydantic import BaseModel, Field
+from app.models.base import ResponseModel
 from datetime import datetime
-import uuid
 from app.models.mood_models import CreativeBriefInput
+from app.utils.uuidpool import next_uuid_str
 
 
 # ============================================================================
@@ -18,16 +19,28 @@ GenerationStatus = Literal["pending", "generating", "complete", "error"]
 # Database Models (Data Layer)
 # ============================================================================
 
+class _TrustedModel(BaseModel):
+    """Base for models that are also rebuilt from data the app produced itself."""
+
+    @classmethod
+    def from_trusted(cls, data: dict):
+        """
+        Build an instance from trusted data (DB/cache/service layer) without
+        running validators. Use model_validate at API ingress instead.
+        """
+        return cls.model_construct(**data)
+
+
 class SceneGenerationStatus(BaseModel):
     """Status tracking for async image and video generation."""
     image: GenerationStatus = Field(default="pending", description="Image generation status")
     video: GenerationStatus = Field(default="pending", description="Video generation status")
 
 
-class StoryboardScene(BaseModel):
+class StoryboardScene(_TrustedModel):
     """Scene model for the unified storyboard interface."""
     # Identity
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique scene ID (UUID)")
+    id: str = Field(default_factory=next_uuid_str, description="Unique scene ID (UUID)")
     storyboard_id: str = Field(..., description="Foreign key to parent storyboard")
 
     # Current state
@@ -66,6 +79,14 @@ class StoryboardScene(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> "StoryboardScene":
+        """Build a scene from trusted data, constructing the nested status too."""
+        status = data.get('generation_status')
+        if isinstance(status, dict):
+            data['generation_status'] = SceneGenerationStatus.model_construct(**status)
+        return cls.model_construct(**data)
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -83,10 +104,10 @@ class StoryboardScene(BaseModel):
         }
 
 
-class Storyboard(BaseModel):
+class Storyboard(_TrustedModel):
     """Storyboard model containing metadata and scene ordering."""
     # Identity
-    storyboard_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique storyboard ID (UUID)")
+    storyboard_id: str = Field(default_factory=next_uuid_str, description="Unique storyboard ID (UUID)")
     project_id: Optional[str] = Field(default=None, description="Project ID this storyboard belongs to (for asset access)")
 
     # Content
@@ -131,7 +152,7 @@ class StoryboardInitializeRequest(BaseModel):
     character_asset_ids: Optional[List[str]] = Field(default=None, description="Character asset IDs from project (uses first if multiple)")
 
 
-class StoryboardInitializeResponse(BaseModel):
+class StoryboardInitializeResponse(ResponseModel):
     """Response from storyboard initialization."""
     success: bool = Field(..., description="Whether initialization was successful")
     storyboard: Optional[Storyboard] = Field(None, description="Created storyboard")
@@ -139,7 +160,7 @@ class StoryboardInitializeResponse(BaseModel):
     message: Optional[str] = Field(None, description="Status message")
 
 
-class StoryboardGetResponse(BaseModel):
+class StoryboardGetResponse(ResponseModel, _TrustedModel):
     """Response for getting a storyboard with all its scenes."""
     storyboard: Storyboard = Field(..., description="Storyboard data")
     scenes: List[StoryboardScene] = Field(..., description="All scenes in order")
@@ -166,7 +187,7 @@ class SceneTrimUpdateRequest(BaseModel):
     trim_end_time: Optional[float] = Field(None, description="Trim end time in seconds", ge=0)
 
 
-class SceneUpdateResponse(BaseModel):
+class SceneUpdateResponse(ResponseModel):
     """Response for scene update operations."""
     success: bool = Field(..., description="Whether update was successful")
     scene: Optional[StoryboardScene] = Field(None, description="Updated scene")
@@ -192,7 +213,7 @@ class SSESceneUpdate(BaseModel):
 # Error Response Models
 # ============================================================================
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(ResponseModel):
     """Standard error response model."""
     success: bool = Field(False, description="Always false for errors")
     error: str = Field(..., description="Error message")
@@ -1,6 +1,7 @@
 """Pydantic models for video generation."""
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
+from app.models.base import ResponseModel
 from enum import Enum
 
 
@@ -29,7 +30,7 @@ class VideoGenerationRequest(BaseModel):
     audio_url: Optional[str] = Field(None, description="URL of background music for the final composition")
 
 
-class VideoGenerationResponse(BaseModel):
+class VideoGenerationResponse(ResponseModel):
     """Response model for video generation initiation."""
     success: bool = Field(..., description="Whether job was successfully initiated")
     job_id: str = Field(..., description="Unique job ID for tracking progress")
@@ -63,7 +64,7 @@ class VideoJobStatus(BaseModel):
     updated_at: str = Field(..., description="Last update timestamp (ISO format)")
 
 
-class VideoJobStatusResponse(BaseModel):
+class VideoJobStatusResponse(ResponseModel):
     """Response model for video job status polling."""
     success: bool = Field(..., description="Whether status retrieval was successful")
     job_status: Optional[VideoJobStatus] = Field(None, description="Current job status")
@@ -1,10 +1,28 @@
 """Admin API router for metrics and monitoring."""
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
+from app.config import settings
 from app.services.metrics_service import get_composite_metrics
-from datetime import datetime, timedelta
-from typing import Dict, List
+import time
+from datetime import date, datetime
+from typing import Dict, List, Tuple
 
-router = APIRouter(prefix="/api/admin", tags=["admin"])
+router = APIRouter(prefix="/api/admin", tags=["admin"], default_response_class=ORJSONResponse)
+
+# Echo timestamps are reused for this long rather than formatted per response
+_TIMESTAMP_TTL_SECONDS = 0.25
+_cached_timestamp: Tuple[float, str] = (float("-inf"), "")
+
+
+def _response_timestamp() -> str:
+    """ISO timestamp for response bodies, refreshed at most every 250ms."""
+    global _cached_timestamp
+    checked_at, value = _cached_timestamp
+    now = time.monotonic()
+    if now - checked_at >= _TIMESTAMP_TTL_SECONDS:
+        value = datetime.now().isoformat()
+        _cached_timestamp = (now, value)
+    return value
 
 
 @router.get("/metrics/composite")
@@ -28,7 +46,7 @@ async def get_composite_generation_metrics() -> Dict:
         return {
             "success": True,
             "stats": stats,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _response_timestamp()
         }
     except Exception as e:
         raise HTTPException(
@@ -57,18 +75,17 @@ async def get_daily_generations(days: int = 7) -> Dict:
             )
         
         metrics = get_composite_metrics()
-        generations: List[Dict] = []
-        
-        for i in range(days):
-            date = (datetime.now() - timedelta(days=i)).date().isoformat()
-            count = metrics.get_daily_count(date)
-            generations.append({
-                "date": date,
-                "count": count
-            })
+        now = datetime.now()
+        today_ord = now.toordinal()
+        dates = [date.fromordinal(today_ord - i).isoformat() for i in range(days)]
+        counts = metrics.get_daily_counts(dates)
+        generations: List[Dict] = [
+            {"date": day, "count": count}
+            for day, count in counts.items()
+        ]
         
         # Calculate total and average
-        total_count = sum(g["count"] for g in generations)
+        total_count = sum(counts.values())
         avg_count = total_count / days if days > 0 else 0
         
         return {
@@ -79,7 +96,7 @@ async def get_daily_generations(days: int = 7) -> Dict:
                 "average_per_day": round(avg_count, 2),
                 "days_requested": days
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now.isoformat()
         }
     except HTTPException:
         raise
@@ -111,23 +128,23 @@ async def get_composite_health() -> Dict:
         warnings = []
         status = "healthy"
         
-        # Check Kontext success rate
         kontext_success_rate = stats["kontext"]["success_rate"]
-        if kontext_success_rate < 0.95 and stats["kontext"]["total_calls"] > 10:
+        fallback_rate = stats["fallback_rate"]
+        
+        # Check Kontext success rate
+        if not metrics.is_kontext_healthy():
             warnings.append(f"Kontext success rate is low: {kontext_success_rate:.1%}")
             status = "degraded"
         
         # Check fallback rate
-        fallback_rate = stats["fallback_rate"]
-        if fallback_rate > 0.1 and stats["kontext"]["total_calls"] > 10:
+        if not metrics.is_fallback_rate_healthy():
             warnings.append(f"High fallback rate: {fallback_rate:.1%}")
             status = "degraded"
         
         # Check daily generation limit
-        from app.config import settings
         today_count = metrics.get_daily_count()
         limit = settings.KONTEXT_DAILY_GENERATION_LIMIT
-        if today_count > limit * 0.9:
+        if today_count * 10 > limit * 9:
             warnings.append(f"Approaching daily limit: {today_count}/{limit}")
             if today_count > limit:
                 status = "critical"
@@ -142,7 +159,7 @@ async def get_composite_health() -> Dict:
                 "today_generations": today_count,
                 "daily_limit": limit
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _response_timestamp()
         }
     except Exception as e:
         raise HTTPException(
@@ -167,31 +184,13 @@ async def reset_metrics() -> Dict:
     try:
         metrics = get_composite_metrics()
         
-        # Reset all metrics to initial state
-        metrics.metrics = {
-            "kontext": {
-                "total_calls": 0,
-                "successful_calls": 0,
-                "failed_calls": 0,
-                "total_time_seconds": 0.0
-            },
-            "pil": {
-                "total_calls": 0,
-                "successful_calls": 0,
-                "failed_calls": 0,
-                "total_time_seconds": 0.0
-            },
-            "fallback_events": 0,
-            "daily_generations": {}
-        }
-        
-        # Save reset state
-        metrics.save_metrics()
+        # Reset all metrics to initial state and save it
+        metrics.reset()
         
         return {
             "success": True,
             "message": "All metrics have been reset",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _response_timestamp()
         }
     except Exception as e:
         raise HTTPException(
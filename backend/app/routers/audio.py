@@ -1,5 +1,8 @@
 """FastAPI router for audio generation endpoints."""
+from functools import lru_cache
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.models.audio_models import (
     AudioGenerationRequest,
@@ -9,24 +12,18 @@ from app.models.audio_models import (
 )
 from app.services.audio_service import AudioGenerationService
 
-router = APIRouter(prefix="/api/audio", tags=["audio"])
-
-# Initialize service
-audio_service = None  # Will be initialized on first request
-
+router = APIRouter(prefix="/api/audio", tags=["audio"], default_response_class=ORJSONResponse)
 
+@lru_cache(maxsize=1)
 def get_audio_service() -> AudioGenerationService:
-    """Get or initialize audio generation service."""
-    global audio_service
-    if audio_service is None:
-        try:
-            audio_service = AudioGenerationService()
-        except ValueError as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Audio generation service not available: {str(e)}"
-            )
-    return audio_service
+    """Get or initialize audio generation service (failed attempts are not cached)."""
+    try:
+        return AudioGenerationService()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Audio generation service not available: {str(e)}"
+        )
 
 
 @router.post("/generate", response_model=AudioGenerationResponse)
@@ -113,14 +110,14 @@ async def generate_audio_for_mood(
         duration = request.duration
 
         # Extract required fields from creative brief
-        emotional_tone = creative_brief.get("emotional_tone", [])
+        emotional_tone = creative_brief.emotional_tone
 
         # For now, we'll need the mood data to be passed in the creative_brief
         # In a full implementation, you would fetch the mood from a database using mood_id
-        mood_name = creative_brief.get("mood_name", "Unknown Mood")
-        mood_description = creative_brief.get("mood_description", "")
-        aesthetic_direction = creative_brief.get("aesthetic_direction", "")
-        style_keywords = creative_brief.get("style_keywords", [])
+        mood_name = creative_brief.mood_name
+        mood_description = creative_brief.mood_description
+        aesthetic_direction = creative_brief.aesthetic_direction
+        style_keywords = creative_brief.style_keywords
 
         # Get audio service
         service = get_audio_service()
@@ -4,16 +4,31 @@ Background Asset Router
 API endpoints for generating and managing background assets.
 """
 
-from fastapi import APIRouter, HTTPException, status
+import secrets
+
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from ..models.background_models import (
     BackgroundAssetUploadResponse,
     BackgroundAssetStatus,
     BackgroundGenerationRequest,
-    BackgroundGenerationResponse
+    BackgroundGenerationJobResponse,
+    BackgroundGenerationJobStatus
 )
 from ..services.background_service import get_background_service
 from .base_asset_router import create_asset_router
 
+# Finished jobs are kept this long for the client to collect the assets
+_JOB_TTL_SECONDS = 60 * 60
+_MAX_JOBS = 1024
+
+# In-memory job tracking, bounded and expiring so abandoned jobs don't
+# accumulate. Only touched from the event loop, so no lock is needed.
+_jobs: TTLCache[str, BackgroundGenerationJobStatus] = TTLCache(
+    maxsize=_MAX_JOBS, ttl=_JOB_TTL_SECONDS
+)
+
 # Create base router for standard asset operations (list, get, delete, upload)
 router = create_asset_router(
     prefix="background",
@@ -23,59 +38,104 @@ router = create_asset_router(
     asset_type_name="background"
 )
 
-# Add custom generate endpoint
-@router.post("/generate", response_model=BackgroundGenerationResponse)
-async def generate_backgrounds(
-    creative_brief: BackgroundGenerationRequest
-) -> BackgroundGenerationResponse:
+async def _process_background_generation(job_id: str, creative_brief: BackgroundGenerationRequest):
     """
-    Generate 6 background images from a creative brief.
-    
-    This endpoint:
-    1. Generates 6 distinct background prompts using AI
-    2. Generates 6 images in parallel using google/nano-banana-pro
-    3. Saves each image as a background asset
-    4. Returns list of background assets
-    
+    Background task that generates the backgrounds for a job.
+
     Args:
-        creative_brief: Creative brief data containing product info, audience, etc.
-    
-    Returns:
-        BackgroundGenerationResponse with 6 background assets
+        job_id: Job identifier
+        creative_brief: Creative brief to generate from
     """
+    job = _jobs.get(job_id)
+    if job is None:
+        # Evicted before it started; nobody can poll for it any more
+        return
+    job.status = "processing"
+
     try:
-        background_service = get_background_service()
-        
-        # Generate backgrounds from brief
-        backgrounds = await background_service.generate_backgrounds_from_brief(creative_brief)
-        
+        backgrounds = await get_background_service().generate_backgrounds_from_brief(creative_brief)
+
         # Count successful generations
         successful = len(backgrounds)
         total = 6
-        
+
         message = f"Generated {successful}/{total} background images"
         if successful < total:
             message += f" ({total - successful} failed)"
-        
-        return BackgroundGenerationResponse(
-            success=True,
-            backgrounds=backgrounds,
-            message=message
-        )
-        
+
+        job.backgrounds = backgrounds
+        job.message = message
+        job.status = "completed"
+
     except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+        # Bad creative brief: the client must change the request
+        job.error = str(e)
+        job.error_status = status.HTTP_400_BAD_REQUEST
+        job.status = "failed"
     except RuntimeError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+        job.error = str(e)
+        job.error_status = status.HTTP_500_INTERNAL_SERVER_ERROR
+        job.status = "failed"
     except Exception as e:
+        job.error = f"Unexpected error during background generation: {str(e)}"
+        job.error_status = status.HTTP_500_INTERNAL_SERVER_ERROR
+        job.status = "failed"
+
+
+# Add custom generate endpoint
+@router.post(
+    "/generate",
+    response_model=BackgroundGenerationJobResponse,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def generate_backgrounds(
+    creative_brief: BackgroundGenerationRequest,
+    background_tasks: BackgroundTasks
+) -> BackgroundGenerationJobResponse:
+    """
+    Start generating 6 background images from a creative brief.
+    
+    The job runs in the background:
+    1. Generates 6 distinct background prompts using AI
+    2. Generates 6 images in parallel using google/nano-banana-pro
+    3. Saves each image as a background asset
+    
+    Returns 202 immediately; poll /generate/status/{job_id} for the assets.
+    
+    Args:
+        creative_brief: Creative brief data containing product info, audience, etc.
+        background_tasks: FastAPI background tasks manager
+    
+    Returns:
+        BackgroundGenerationJobResponse with job_id for tracking
+    """
+    job_id = secrets.token_hex(16)
+    _jobs[job_id] = BackgroundGenerationJobStatus(job_id=job_id, status="pending")
+    background_tasks.add_task(_process_background_generation, job_id, creative_brief)
+
+    return BackgroundGenerationJobResponse(
+        success=True,
+        job_id=job_id,
+        message="Background generation job created"
+    )
+
+
+@router.get("/generate/status/{job_id}", response_model=BackgroundGenerationJobStatus, response_class=ORJSONResponse)
+async def get_background_generation_status(job_id: str) -> BackgroundGenerationJobStatus:
+    """
+    Get the current status of a background generation job.
+
+    Args:
+        job_id: Job identifier from /generate
+
+    Returns:
+        BackgroundGenerationJobStatus; backgrounds are set once completed
+    """
+    job = _jobs.get(job_id)
+    if job is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error during background generation: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
         )
-
+    return job
@@ -4,10 +4,11 @@ Base Asset Router Factory
 Generic router factory for creating asset upload routers.
 """
 
+import asyncio
 import logging
 from typing import TypeVar, Generic, List, Optional
-from fastapi import APIRouter, File, UploadFile, HTTPException, status, Header, Request
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status, Header, Query, Response
+from fastapi.responses import ORJSONResponse, RedirectResponse
 
 from ..models.asset_models import AssetUploadResponse, AssetStatus
 
@@ -16,20 +17,58 @@ S = TypeVar('S', bound=AssetStatus)
 
 logger = logging.getLogger(__name__)
 
+# File signatures accepted for upload: PNG, and JPEG's SOI marker plus the next marker's 0xFF
+_PNG_SIG = b"\x89PNG\r\n\x1a\n"
+_JPEG_SIG = b"\xff\xd8\xff"
 
-def get_user_id_from_request(request: Request) -> Optional[str]:
-    """Extract user_id from request headers or query parameters."""
-    # Try X-User-Id header first (sent by frontend for API calls)
-    user_id = request.headers.get("X-User-Id")
-    if user_id:
-        return user_id
-    
-    # Fallback: try query parameter (for image URLs used in img src tags)
-    user_id = request.query_params.get("user_id")
-    if user_id:
-        return user_id
+# Caps how many uploads decode/resize images in worker threads at once,
+# shared by every asset router
+_UPLOAD_PROCESSING_LIMIT = asyncio.Semaphore(8)
+
+
+def require_user_id(
+    x_user_id: Optional[str] = Header(None),
+    user_id: Optional[str] = Query(None)
+) -> str:
+    """
+    Resolve the requesting user's id, rejecting the request with 401 if absent.
     
-    return None
+    Read from the X-User-Id header (sent by frontend for API calls), falling
+    back to the user_id query parameter (for image URLs used in img src tags).
+    """
+    resolved = x_user_id or user_id
+    if not resolved:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User ID is required. Please ensure you are authenticated."
+        )
+    return resolved
+
+
+# Assets belong to one user, so only the browser may cache the redirect, and
+# it revalidates each use: ownership is re-checked and an unchanged asset
+# costs a 304 against the ETag
+_ASSET_CACHE_CONTROL = "private, no-cache"
+
+
+def _asset_etag(asset_id: str, thumbnail: bool) -> str:
+    """Strong ETag for an asset image; the id alone identifies its content."""
+    return f'"{asset_id}-{"t" if thumbnail else "f"}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches etag.
+
+    Handles ``*`` and comma-separated lists, and compares weakly (a ``W/``
+    prefix is ignored) as RFC 9110 requires for If-None-Match.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
 
 
 def create_asset_router(
@@ -45,7 +84,7 @@ def create_asset_router(
     Args:
         prefix: API prefix (e.g., "brand", "character")
         tag: OpenAPI tag name
-        service: Service instance with methods: save_asset, get_asset, list_assets, delete_asset, get_asset_path
+        service: Service instance with methods: save_asset, get_asset, list_assets, delete_asset, resolve_owned_url
         response_class: Response model class
         asset_type_name: Human-readable asset type name for error messages
     
@@ -56,8 +95,8 @@ def create_asset_router(
     
     @router.post("/upload", response_model=response_class)
     async def upload_asset(
-        request: Request,
-        file: UploadFile = File(..., description=f"{asset_type_name} asset image to upload")
+        file: UploadFile = File(..., description=f"{asset_type_name} asset image to upload"),
+        user_id: str = Depends(require_user_id)
     ):
         """
         Upload a single asset image.
@@ -89,20 +128,25 @@ def create_asset_router(
         
         logger.info(f"Received {asset_type_name} asset upload: {file.filename}")
         
-        # Get user_id from request headers
-        user_id = get_user_id_from_request(request)
-        if not user_id:
+        # Reject non-images from their first bytes before any decoding work
+        head = await file.read(len(_PNG_SIG))
+        await file.seek(0)
+        if not (head.startswith(_PNG_SIG) or head.startswith(_JPEG_SIG)):
             raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User ID is required. Please ensure you are authenticated."
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Only PNG and JPG images are supported (invalid file format)"
             )
         
         try:
-            # Read file data
-            file_data = await file.read()
-            
-            # Save asset with user_id
-            response = service.save_asset(file_data, file.filename or f"{prefix}-asset.png", user_id=user_id)
+            # Hand over the spooled upload file itself rather than reading
+            # the whole body (up to 50MB) into memory
+            async with _UPLOAD_PROCESSING_LIMIT:
+                response = await asyncio.to_thread(
+                    service.save_asset,
+                    file.file,
+                    file.filename or f"{prefix}-asset.png",
+                    user_id=user_id,
+                )
             
             logger.info(f"{asset_type_name.capitalize()} asset uploaded successfully: {response.asset_id} for user {user_id}")
             return response
@@ -122,39 +166,25 @@ def create_asset_router(
             )
     
     @router.get("", response_model=List[AssetStatus])
-    async def list_assets(request: Request):
+    async def list_assets(user_id: str = Depends(require_user_id)):
         """
         List assets for the current user.
         
         Returns a list of assets belonging to the authenticated user, sorted by most recent first.
         """
-        # Get user_id from request headers
-        user_id = get_user_id_from_request(request)
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User ID is required. Please ensure you are authenticated."
-            )
-        
+        # Statuses are built from stored records by the service; returning the
+        # response directly skips FastAPI re-validating every item of the list.
         assets = service.list_assets(user_id=user_id)
-        return assets
+        return ORJSONResponse([asset.model_dump() for asset in assets])
     
     @router.get("/{asset_id}", response_model=AssetStatus)
-    async def get_asset_metadata(asset_id: str, request: Request):
+    async def get_asset_metadata(asset_id: str, user_id: str = Depends(require_user_id)):
         """
         Get asset metadata.
         
         Returns asset information including URLs and dimensions.
         Only returns assets belonging to the authenticated user.
         """
-        # Get user_id from request headers
-        user_id = get_user_id_from_request(request)
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User ID is required. Please ensure you are authenticated."
-            )
-        
         asset = service.get_asset(asset_id, user_id=user_id)
         
         if not asset:
@@ -165,84 +195,54 @@ def create_asset_router(
         
         return asset
     
-    @router.get("/{asset_id}/image")
-    async def get_asset_image_file(asset_id: str, request: Request):
-        """
-        Get the full asset image file.
-        Only accessible if the asset belongs to the authenticated user.
-        """
-        # Get user_id from request headers
-        user_id = get_user_id_from_request(request)
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User ID is required. Please ensure you are authenticated."
-            )
+    def serve_asset_file(asset_id: str, user_id: str, if_none_match: Optional[str], thumbnail: bool):
+        """Redirect to an owned asset's image or thumbnail in Firebase Storage, or 304/404."""
+        kind = "thumbnail" if thumbnail else "image"
         
-        # Verify ownership
-        asset = service.get_asset(asset_id, user_id=user_id)
-        if not asset:
+        # Ownership check and URL lookup in one service call
+        image_url = service.resolve_owned_url(asset_id, user_id, thumbnail=thumbnail)
+        if not image_url:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"{asset_type_name.capitalize()} asset image {asset_id} not found"
+                detail=f"{asset_type_name.capitalize()} asset {kind} {asset_id} not found"
             )
         
-        image_path = service.get_asset_path(asset_id, thumbnail=False)
+        headers = {"ETag": _asset_etag(asset_id, thumbnail=thumbnail), "Cache-Control": _ASSET_CACHE_CONTROL}
+        if _etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
         
-        if not image_path or not image_path.exists():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"{asset_type_name.capitalize()} asset image {asset_id} not found"
-            )
-        
-        return FileResponse(image_path)
+        return RedirectResponse(image_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT, headers=headers)
+    
+    @router.get("/{asset_id}/image")
+    async def get_asset_image_file(
+        asset_id: str,
+        user_id: str = Depends(require_user_id),
+        if_none_match: Optional[str] = Header(None)
+    ):
+        """
+        Get the full asset image file.
+        Only accessible if the asset belongs to the authenticated user.
+        """
+        return serve_asset_file(asset_id, user_id, if_none_match, thumbnail=False)
     
     @router.get("/{asset_id}/thumbnail")
-    async def get_asset_thumbnail_file(asset_id: str, request: Request):
+    async def get_asset_thumbnail_file(
+        asset_id: str,
+        user_id: str = Depends(require_user_id),
+        if_none_match: Optional[str] = Header(None)
+    ):
         """
         Get the asset thumbnail (512×512).
         Only accessible if the asset belongs to the authenticated user.
         """
-        # Get user_id from request headers
-        user_id = get_user_id_from_request(request)
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User ID is required. Please ensure you are authenticated."
-            )
-        
-        # Verify ownership
-        asset = service.get_asset(asset_id, user_id=user_id)
-        if not asset:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"{asset_type_name.capitalize()} asset thumbnail {asset_id} not found"
-            )
-        
-        image_path = service.get_asset_path(asset_id, thumbnail=True)
-        
-        if not image_path or not image_path.exists():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"{asset_type_name.capitalize()} asset thumbnail {asset_id} not found"
-            )
-        
-        return FileResponse(image_path)
+        return serve_asset_file(asset_id, user_id, if_none_match, thumbnail=True)
     
     @router.delete("/{asset_id}")
-    async def delete_asset(asset_id: str, request: Request):
+    async def delete_asset(asset_id: str, user_id: str = Depends(require_user_id)):
         """
         Delete an asset and all associated files.
         Only allows deletion of assets belonging to the authenticated user.
         """
-        # Get user_id from request headers
-        user_id = get_user_id_from_request(request)
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User ID is required. Please ensure you are authenticated."
-            )
-        
         success = service.delete_asset(asset_id, user_id=user_id)
         
         if not success:
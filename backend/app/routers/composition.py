@@ -1,47 +1,55 @@
 """FastAPI router for video composition endpoints."""
-import uuid
-from datetime import datetime
-from typing import Dict, Optional
+import secrets
+import socket
+import time
+from dataclasses import asdict
+from functools import lru_cache
+from typing import Optional
 from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from pathlib import Path
 
 from app.models.composition_models import (
     CompositionRequest,
     CompositionResponse,
-    CompositionJobStatus,
+    CompositionJobState,
     CompositionJobStatusResponse,
     CompositionStatus,
     RenderVideoRequest,
     RenderVideoResponse
 )
+from app.services.composition_job_store import get_composition_job_store
 from app.services.ffmpeg_service import FFmpegCompositionService
 
-router = APIRouter(prefix="/api/composition", tags=["composition"])
+router = APIRouter(prefix="/api/composition", tags=["composition"], default_response_class=ORJSONResponse)
 
-# In-memory job tracking
-# In production, this should be replaced with Redis or a database
-_jobs: Dict[str, CompositionJobStatus] = {}
+# Recorded with each output file_path, which is only meaningful on the host
+# that rendered it
+_HOST = socket.gethostname()
 
-# Initialize composition service
-composition_service = None  # Will be initialized on first request
+def _now_ms() -> int:
+    """Current time as integer epoch milliseconds (job timestamps)."""
+    return time.time_ns() // 1_000_000
 
 
+@lru_cache(maxsize=1)
 def get_composition_service() -> FFmpegCompositionService:
-    """Get or initialize FFmpeg composition service."""
-    global composition_service
-    if composition_service is None:
-        try:
-            composition_service = FFmpegCompositionService()
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Composition service not available: {str(e)}"
-            )
-    return composition_service
+    """Get or initialize FFmpeg composition service (failed attempts are not cached)."""
+    try:
+        return FFmpegCompositionService()
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Composition service not available: {str(e)}"
+        )
+
 
+def warm_up() -> None:
+    """Build the composition service at app startup."""
+    get_composition_service()
 
-def _create_composition_job(request: CompositionRequest) -> str:
+
+async def _create_composition_job(request: CompositionRequest) -> str:
     """
     Create a new video composition job.
 
@@ -51,31 +59,25 @@ def _create_composition_job(request: CompositionRequest) -> str:
     Returns:
         job_id: Unique identifier for the job
     """
-    job_id = str(uuid.uuid4())
-    now = datetime.utcnow().isoformat()
+    job_id = secrets.token_hex(16)
+    now = _now_ms()
 
     # Create job status
-    job_status = CompositionJobStatus(
+    job_status = CompositionJobState(
         job_id=job_id,
         status=CompositionStatus.PENDING,
-        progress_percent=0,
         total_clips=len(request.clips),
-        current_step="Job created",
-        video_url=None,
-        file_size_mb=None,
-        duration_seconds=None,
-        error=None,
         created_at=now,
-        updated_at=now
+        updated_at=now,
+        current_step="Job created"
     )
 
-    # Store in memory
-    _jobs[job_id] = job_status
+    await get_composition_job_store().set(job_status)
 
     return job_id
 
 
-def _update_job_status(
+async def _update_job_status(
     job_id: str,
     status: CompositionStatus,
     progress: int,
@@ -98,25 +100,21 @@ def _update_job_status(
         duration_seconds: Duration in seconds (if completed)
         error: Error message (if failed)
     """
-    if job_id not in _jobs:
-        return
-
-    job = _jobs[job_id]
-    job.status = status
-    job.progress_percent = progress
+    changes = {"status": status, "progress_percent": progress}
 
     if current_step:
-        job.current_step = current_step
+        changes["current_step"] = current_step
     if video_url:
-        job.video_url = video_url
+        changes["video_url"] = video_url
     if file_size_mb is not None:
-        job.file_size_mb = file_size_mb
+        changes["file_size_mb"] = file_size_mb
     if duration_seconds is not None:
-        job.duration_seconds = duration_seconds
+        changes["duration_seconds"] = duration_seconds
     if error:
-        job.error = error
+        changes["error"] = error
 
-    job.updated_at = datetime.utcnow().isoformat()
+    changes["updated_at"] = _now_ms()
+    await get_composition_job_store().update(job_id, **changes)
 
 
 async def _process_composition(job_id: str, request: CompositionRequest):
@@ -127,7 +125,7 @@ async def _process_composition(job_id: str, request: CompositionRequest):
         job_id: Job identifier
         request: Composition request
     """
-    if job_id not in _jobs:
+    if await get_composition_job_store().get(job_id) is None:
         return
 
     try:
@@ -135,7 +133,7 @@ async def _process_composition(job_id: str, request: CompositionRequest):
         service = get_composition_service()
 
         # Step 1: Downloading
-        _update_job_status(
+        await _update_job_status(
             job_id,
             CompositionStatus.DOWNLOADING,
             10,
@@ -143,7 +141,7 @@ async def _process_composition(job_id: str, request: CompositionRequest):
         )
 
         # Step 2: Composing
-        _update_job_status(
+        await _update_job_status(
             job_id,
             CompositionStatus.COMPOSING,
             30,
@@ -163,19 +161,20 @@ async def _process_composition(job_id: str, request: CompositionRequest):
         ]
 
         # Compose video
-        output_path = await service.compose_video(
+        composed = await service.compose_video(
             video_clips=clips_data,
             audio_url=request.audio_url,
             include_crossfade=request.include_crossfade,
             target_bitrate="3M" if not request.optimize_size else "2500k"
         )
 
-        if not output_path or not output_path.exists():
+        if not composed or not composed[0].exists():
             raise Exception("Video composition failed to produce output file")
+        output_path, duration_seconds = composed
 
         # Step 3: Optimizing (if requested)
         if request.optimize_size:
-            _update_job_status(
+            await _update_job_status(
                 job_id,
                 CompositionStatus.OPTIMIZING,
                 80,
@@ -184,27 +183,24 @@ async def _process_composition(job_id: str, request: CompositionRequest):
 
             output_path = await service.optimize_file_size(
                 output_path,
-                target_size_mb=request.target_size_mb
+                target_size_mb=request.target_size_mb,
+                duration_seconds=duration_seconds
             )
 
         # Step 4: Completed
         # Get file info
         file_size_mb = output_path.stat().st_size / (1024 * 1024)
 
-        # Calculate duration
-        from ffmpeg import probe
-        probe_data = probe(str(output_path))
-        duration_seconds = float(probe_data['format']['duration'])
-
         # For now, video_url is the local file path
         # In production, you would upload this to cloud storage (S3, etc.)
         video_url = f"/api/composition/download/{job_id}"
 
         # Store file path and URL separately
-        _jobs[job_id].file_path = str(output_path)
-        _jobs[job_id].video_url = video_url
+        await get_composition_job_store().update(
+            job_id, file_path=str(output_path), file_host=_HOST, video_url=video_url
+        )
 
-        _update_job_status(
+        await _update_job_status(
             job_id,
             CompositionStatus.COMPLETED,
             100,
@@ -221,7 +217,7 @@ async def _process_composition(job_id: str, request: CompositionRequest):
         error_msg = f"Composition failed: {str(e)}"
         print(f"✗ Job {job_id} failed: {error_msg}")
 
-        _update_job_status(
+        await _update_job_status(
             job_id,
             CompositionStatus.FAILED,
             0,
@@ -271,7 +267,7 @@ async def compose_video(
             )
 
         # Create job
-        job_id = _create_composition_job(request)
+        job_id = await _create_composition_job(request)
 
         # Start background composition
         background_tasks.add_task(_process_composition, job_id, request)
@@ -293,7 +289,7 @@ async def compose_video(
 
 
 @router.get("/status/{job_id}", response_model=CompositionJobStatusResponse)
-async def get_composition_status(job_id: str) -> CompositionJobStatusResponse:
+async def get_composition_status(job_id: str) -> ORJSONResponse:
     """
     Get the current status of a composition job.
 
@@ -301,23 +297,23 @@ async def get_composition_status(job_id: str) -> CompositionJobStatusResponse:
         job_id: Unique job identifier from /compose endpoint
 
     Returns:
-        CompositionJobStatusResponse with current job status
+        CompositionJobStatusResponse with current job status (serialized
+        straight from the stored job state; the model documents the shape)
     """
     try:
         # Check if job exists
-        if job_id not in _jobs:
+        job = await get_composition_job_store().get(job_id)
+        if job is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Job {job_id} not found"
             )
 
-        job_status = _jobs[job_id]
-
-        return CompositionJobStatusResponse(
-            success=True,
-            job_status=job_status,
-            message=f"Job status: {job_status.status.value}"
-        )
+        return ORJSONResponse({
+            "success": True,
+            "job_status": asdict(job),
+            "message": f"Job status: {job.status.value}"
+        })
 
     except HTTPException:
         raise
@@ -328,11 +324,15 @@ async def get_composition_status(job_id: str) -> CompositionJobStatusResponse:
         )
 
 
-@router.get("/download/{job_id}")
+@router.api_route("/download/{job_id}", methods=["GET", "HEAD"])
 async def download_video(job_id: str):
     """
     Download the composed video file.
 
+    FileResponse answers Range requests with 206 partial content (so
+    <video> can seek without fetching the whole file) and HEAD with the
+    headers only.
+
     Args:
         job_id: Unique job identifier
 
@@ -341,14 +341,13 @@ async def download_video(job_id: str):
     """
     try:
         # Check if job exists
-        if job_id not in _jobs:
+        job = await get_composition_job_store().get(job_id)
+        if job is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Job {job_id} not found"
             )
 
-        job = _jobs[job_id]
-
         # Check if job is completed
         if job.status != CompositionStatus.COMPLETED:
             raise HTTPException(
@@ -364,6 +363,16 @@ async def download_video(job_id: str):
             )
 
         video_path = Path(job.file_path)
+        if not video_path.exists() and job.file_host not in (None, _HOST):
+            # Job state is shared through Redis but the file is not
+            raise HTTPException(
+                status_code=404,
+                detail=(
+                    f"Video for job {job_id} was rendered on {job.file_host} and is not "
+                    "available on this worker; multi-worker deployments need a shared "
+                    "composition directory or sticky routing"
+                )
+            )
         if not video_path.exists():
             raise HTTPException(
                 status_code=404,
@@ -437,56 +446,52 @@ async def render_video(request: RenderVideoRequest) -> RenderVideoResponse:
         ]
 
         # Render video without audio and without crossfades
-        output_path = await service.compose_video(
+        composed = await service.compose_video(
             video_clips=clips_data,
             audio_url=None,  # No audio
             include_crossfade=False,  # No crossfades, just concatenate
             target_bitrate="2500k" if request.optimize_size else "3M"
         )
 
-        if not output_path or not output_path.exists():
+        if not composed or not composed[0].exists():
             raise HTTPException(
                 status_code=500,
                 detail="Video rendering failed to produce output file"
             )
+        output_path, duration_seconds = composed
 
         # Optimize if requested
         if request.optimize_size:
             output_path = await service.optimize_file_size(
                 output_path,
-                target_size_mb=request.target_size_mb
+                target_size_mb=request.target_size_mb,
+                duration_seconds=duration_seconds
             )
 
         # Get file info
         file_size_mb = output_path.stat().st_size / (1024 * 1024)
 
-        # Calculate duration
-        from ffmpeg import probe
-        probe_data = probe(str(output_path))
-        duration_seconds = float(probe_data['format']['duration'])
-
         # Create a temporary job ID for file access
         # In production, you might want to upload to cloud storage
-        job_id = str(uuid.uuid4())
+        job_id = secrets.token_hex(16)
         video_url = f"/api/composition/download/{job_id}"
+        now = _now_ms()
 
-        # Store file path temporarily (will be cleaned up later)
-        # For now, we'll use a simple in-memory mapping
-        # In production, use proper temporary storage
-        _jobs[job_id] = CompositionJobStatus(
+        # Record the render as a completed job so /download can serve it
+        await get_composition_job_store().set(CompositionJobState(
             job_id=job_id,
             status=CompositionStatus.COMPLETED,
-            progress_percent=100,
             total_clips=len(request.clips),
+            created_at=now,
+            updated_at=now,
+            progress_percent=100,
             current_step="Rendered",
             video_url=video_url,
             file_path=str(output_path),
+            file_host=_HOST,
             file_size_mb=file_size_mb,
-            duration_seconds=duration_seconds,
-            error=None,
-            created_at=datetime.utcnow().isoformat(),
-            updated_at=datetime.utcnow().isoformat()
-        )
+            duration_seconds=duration_seconds
+        ))
 
         return RenderVideoResponse(
             success=True,
@@ -507,8 +512,9 @@ async def render_video(request: RenderVideoRequest) -> RenderVideoResponse:
 @router.get("/jobs")
 async def list_jobs():
     """List all composition jobs (for debugging)."""
+    jobs = await get_composition_job_store().list()
     return {
-        "total_jobs": len(_jobs),
+        "total_jobs": len(jobs),
         "jobs": [
             {
                 "job_id": job.job_id,
@@ -518,9 +524,10 @@ async def list_jobs():
                 "current_step": job.current_step,
                 "video_url": job.video_url,
                 "file_path": job.file_path,
+                "file_host": job.file_host,
                 "file_size_mb": job.file_size_mb,
                 "duration_seconds": job.duration_seconds
             }
-            for job in _jobs.values()
+            for job in jobs
         ]
     }
@@ -1,5 +1,9 @@
 """FastAPI router for mood generation endpoints."""
+import asyncio
+from functools import lru_cache
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.models.mood_models import (
     CreativeBriefInput,
@@ -11,25 +15,32 @@ from app.models.mood_models import (
 from app.services.mood_service import MoodGenerationService
 from app.services.replicate_service import ReplicateImageService
 
-router = APIRouter(prefix="/api/moods", tags=["moods"])
+router = APIRouter(prefix="/api/moods", tags=["moods"], default_response_class=ORJSONResponse)
 
 # Initialize services
 mood_service = MoodGenerationService()
-replicate_service = None  # Will be initialized on first request
+
+# Caps concurrent image persists (download from Replicate + Storage upload)
+# across all mood requests, so a large generation can't flood the thread
+# pool or Storage
+_PERSIST_LIMIT = asyncio.Semaphore(8)
 
 
+@lru_cache(maxsize=1)
 def get_replicate_service() -> ReplicateImageService:
-    """Get or initialize Replicate service."""
-    global replicate_service
-    if replicate_service is None:
-        try:
-            replicate_service = ReplicateImageService()
-        except ValueError as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Replicate service not available: {str(e)}"
-            )
-    return replicate_service
+    """Get or initialize Replicate service (failed attempts are not cached)."""
+    try:
+        return ReplicateImageService()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Replicate service not available: {str(e)}"
+        )
+
+
+def warm_up() -> None:
+    """Build the Replicate service at app startup."""
+    get_replicate_service()
 
 
 @router.post("/generate", response_model=MoodGenerationResponse)
@@ -107,8 +118,21 @@ async def generate_moods(
         )
         print(f"Completed generation: {sum(1 for r in image_results if r['success'])}/{len(image_results)} successful")
         
-        # Step 4: Persist images to Firebase Storage and organize by mood
+        # Step 4: Persist images to Firebase Storage concurrently, then organize by mood
         print(f"Persisting {len(image_results)} images to Firebase Storage...")
+        
+        async def persist(result) -> str:
+            image_url = result["image_url"] or ""
+            if result["success"] and image_url:
+                # Blocking download + upload, so each runs in its own thread
+                async with _PERSIST_LIMIT:
+                    return await asyncio.to_thread(
+                        replicate_svc.persist_replicate_image, image_url, folder="moods"
+                    )
+            return image_url
+        
+        persisted_urls = await asyncio.gather(*(persist(result) for result in image_results))
+        
         moods_with_images = []
         for mood_idx, mood in enumerate(mood_directions):
             # Each mood gets images_per_mood images, so calculate the range
@@ -120,14 +144,7 @@ async def generate_moods(
             
             # Build MoodImage objects with persisted URLs
             mood_images = []
-            for idx, result in enumerate(mood_image_results):
-                image_url = result["image_url"] or ""
-                
-                # Persist successful images to Firebase Storage
-                if result["success"] and image_url:
-                    print(f"[Mood {mood_idx + 1}/{len(mood_directions)}] Persisting image {idx + 1}/{len(mood_image_results)}...")
-                    image_url = replicate_svc.persist_replicate_image(image_url, folder="moods")
-                
+            for result, image_url in zip(mood_image_results, persisted_urls[start_idx:end_idx]):
                 mood_images.append(MoodImage(
                     url=image_url,
                     prompt=result["prompt"],
@@ -142,7 +159,7 @@ async def generate_moods(
                 style_keywords=mood["style_keywords"],
                 color_palette=mood["color_palette"],
                 aesthetic_direction=mood["aesthetic_direction"],
-                images=mood_images
+                images=tuple(mood_images)
             ))
         
         # Count successful images
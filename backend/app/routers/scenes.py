@@ -1,5 +1,6 @@
 """FastAPI router for scene planning endpoints."""
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.models.scene_models import (
     ScenePlanRequest,
@@ -14,7 +15,7 @@ from app.services.scene_service import SceneGenerationService
 from app.services.replicate_service import ReplicateImageService
 from app.config import settings
 
-router = APIRouter(prefix="/api/scenes", tags=["scenes"])
+router = APIRouter(prefix="/api/scenes", tags=["scenes"], default_response_class=ORJSONResponse)
 
 # Initialize services
 scene_service = SceneGenerationService()
@@ -1,7 +1,7 @@
 """API router for storyboard operations."""
-from fastapi import APIRouter, HTTPException, status, BackgroundTasks
-from fastapi.responses import StreamingResponse
-from typing import AsyncGenerator, List, Optional
+from fastapi import APIRouter, HTTPException, Request, status, BackgroundTasks
+from fastapi.responses import Response, StreamingResponse
+from typing import AsyncGenerator, Dict, List, Optional, Union
 from pydantic import BaseModel, Field
 from app.models.storyboard_models import (
     StoryboardInitializeRequest,
@@ -12,7 +12,6 @@ from app.models.storyboard_models import (
     SceneDurationUpdateRequest,
     SceneTrimUpdateRequest,
     SceneUpdateResponse,
-    SSESceneUpdate,
     ErrorResponse,
 )
 from app.services.storyboard_service import storyboard_service
@@ -21,10 +20,13 @@ from app.services.replicate_service import get_replicate_service
 from app.services.metrics_service import get_composite_metrics
 from app.services.brand_service import get_brand_service
 from app.services.character_service import get_character_service
-from app.database import db
+from app.database import get_db
 from app.config import settings
+from app.utils.serialization import to_json_bytes
 import json
+import orjson
 import asyncio
+import zlib
 from datetime import datetime
 import replicate
 import logging
@@ -45,6 +47,18 @@ router = APIRouter(
 # Storyboard Endpoints
 # ============================================================================
 
+
+def _storyboard_response(storyboard, scenes) -> Response:
+    """Serialize a storyboard and its scenes as a StoryboardGetResponse body.
+
+    The data comes from the service layer, so it is neither re-validated
+    (no response_model) nor dumped to dicts first: the model is built
+    unvalidated and written straight to JSON bytes.
+    """
+    body = StoryboardGetResponse.from_trusted({"storyboard": storyboard, "scenes": scenes})
+    return Response(content=to_json_bytes(body), media_type="application/json")
+
+
 @router.post("/initialize", response_model=StoryboardInitializeResponse)
 async def initialize_storyboard(request: StoryboardInitializeRequest):
     """
@@ -77,7 +91,7 @@ async def initialize_storyboard(request: StoryboardInitializeRequest):
         )
 
 
-@router.get("/{storyboard_id}", response_model=StoryboardGetResponse)
+@router.get("/{storyboard_id}", responses={200: {"model": StoryboardGetResponse}})
 async def get_storyboard(storyboard_id: str):
     """
     Get a storyboard with all its scenes.
@@ -89,10 +103,7 @@ async def get_storyboard(storyboard_id: str):
     try:
         storyboard, scenes = await storyboard_service.get_storyboard_with_scenes(storyboard_id)
 
-        return StoryboardGetResponse(
-            storyboard=storyboard,
-            scenes=scenes
-        )
+        return _storyboard_response(storyboard, scenes)
 
     except ValueError as e:
         raise HTTPException(
@@ -115,7 +126,7 @@ async def regenerate_all_scenes(storyboard_id: str):
     """
     try:
         # Get existing storyboard
-        storyboard = db.get_storyboard(storyboard_id)
+        storyboard = get_db().get_storyboard(storyboard_id)
         if not storyboard:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -124,7 +135,7 @@ async def regenerate_all_scenes(storyboard_id: str):
 
         # Delete existing scenes
         for scene_id in storyboard.scene_order:
-            db.delete_scene(scene_id)
+            get_db().delete_scene(scene_id)
 
         # Generate new scenes
         # Note: storyboard.creative_brief is stored as a string, so we pass it directly
@@ -151,12 +162,12 @@ async def regenerate_all_scenes(storyboard_id: str):
                 )
             )
             scenes.append(scene)
-            db.create_scene(scene)
+        get_db().create_scenes(scenes)
 
         # Update storyboard with new scene order
         storyboard.scene_order = [scene.id for scene in scenes]
         storyboard.updated_at = datetime.utcnow()
-        db.update_storyboard(storyboard_id, storyboard)
+        get_db().update_storyboard(storyboard_id, storyboard)
 
         return StoryboardInitializeResponse(
             success=True,
@@ -280,7 +291,7 @@ class ReorderScenesRequest(BaseModel):
     scene_order: List[str] = Field(..., description="New ordered list of scene IDs")
 
 
-@router.post("/{storyboard_id}/scenes", response_model=StoryboardGetResponse)
+@router.post("/{storyboard_id}/scenes", responses={200: {"model": StoryboardGetResponse}})
 async def add_scene(storyboard_id: str, request: AddSceneRequest):
     """
     Add a new scene to the storyboard.
@@ -294,10 +305,7 @@ async def add_scene(storyboard_id: str, request: AddSceneRequest):
             position=request.position
         )
         
-        return StoryboardGetResponse(
-            storyboard=storyboard,
-            scenes=scenes
-        )
+        return _storyboard_response(storyboard, scenes)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -310,7 +318,7 @@ async def add_scene(storyboard_id: str, request: AddSceneRequest):
         )
 
 
-@router.delete("/{storyboard_id}/scenes/{scene_id}", response_model=StoryboardGetResponse)
+@router.delete("/{storyboard_id}/scenes/{scene_id}", responses={200: {"model": StoryboardGetResponse}})
 async def remove_scene(storyboard_id: str, scene_id: str):
     """
     Remove a scene from the storyboard.
@@ -323,10 +331,7 @@ async def remove_scene(storyboard_id: str, scene_id: str):
             scene_id=scene_id
         )
         
-        return StoryboardGetResponse(
-            storyboard=storyboard,
-            scenes=scenes
-        )
+        return _storyboard_response(storyboard, scenes)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -339,7 +344,7 @@ async def remove_scene(storyboard_id: str, scene_id: str):
         )
 
 
-@router.put("/{storyboard_id}/scenes/reorder", response_model=StoryboardGetResponse)
+@router.put("/{storyboard_id}/scenes/reorder", responses={200: {"model": StoryboardGetResponse}})
 async def reorder_scenes(storyboard_id: str, request: ReorderScenesRequest):
     """
     Reorder scenes in the storyboard.
@@ -352,10 +357,7 @@ async def reorder_scenes(storyboard_id: str, request: ReorderScenesRequest):
             new_scene_order=request.scene_order
         )
         
-        return StoryboardGetResponse(
-            storyboard=storyboard,
-            scenes=scenes
-        )
+        return _storyboard_response(storyboard, scenes)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -380,7 +382,7 @@ async def get_scene_status(storyboard_id: str, scene_id: str):
     Used for polling fallback when SSE is not available.
     """
     try:
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -442,7 +444,7 @@ async def enable_product_composite(
             )
         
         # Get scene
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -459,7 +461,7 @@ async def enable_product_composite(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
         
         return {
             "success": True,
@@ -489,7 +491,7 @@ async def disable_product_composite(
     """
     try:
         # Get scene
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -506,7 +508,7 @@ async def disable_product_composite(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
         
         return {
             "success": True,
@@ -566,7 +568,7 @@ async def enable_brand_asset(
             )
         
         # Get scene
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -582,7 +584,7 @@ async def enable_brand_asset(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
         
         return {
             "success": True,
@@ -612,7 +614,7 @@ async def disable_brand_asset(
     """
     try:
         # Get scene
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -628,7 +630,7 @@ async def disable_brand_asset(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
         
         return {
             "success": True,
@@ -669,7 +671,7 @@ async def enable_character_asset(
             )
         
         # Get scene
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -685,7 +687,7 @@ async def enable_character_asset(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
         
         return {
             "success": True,
@@ -727,7 +729,7 @@ async def enable_background_asset(
             )
         
         # Get scene
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -743,7 +745,7 @@ async def enable_background_asset(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
         
         return {
             "success": True,
@@ -773,7 +775,7 @@ async def disable_background_asset(
     """
     try:
         # Get scene
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -789,7 +791,7 @@ async def disable_background_asset(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
         
         return {
             "success": True,
@@ -819,7 +821,7 @@ async def disable_character_asset(
     """
     try:
         # Get scene
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -835,7 +837,7 @@ async def disable_character_asset(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
         
         return {
             "success": True,
@@ -864,7 +866,7 @@ async def generate_image_task(scene_id: str):
     print(f"[Image Generation] Scene ID: {scene_id}")
     
     try:
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             print(f"[Image Generation] ❌ ERROR: Scene {scene_id} not found")
             return
@@ -878,7 +880,7 @@ async def generate_image_task(scene_id: str):
 
         # Update status to generating
         scene.generation_status.image = "generating"
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
         print(f"[Image Generation] Status updated to 'generating'")
         
         # Get webhook URL for Replicate callbacks
@@ -893,7 +895,7 @@ async def generate_image_task(scene_id: str):
             scene.generation_status.image = "complete"
             scene.image_url = f"https://via.placeholder.com/1920x1080/000000/FFFFFF?text=Scene+{scene_id[:8]}"
             scene.state = "image"
-            db.update_scene(scene_id, scene)
+            get_db().update_scene(scene_id, scene)
             print(f"[Image Generation] Placeholder image set for scene {scene_id}")
             return
 
@@ -1102,7 +1104,7 @@ async def generate_image_task(scene_id: str):
                 
                 # Store prediction ID in scene
                 scene.replicate_image_prediction_id = prediction_id
-                db.update_scene(scene_id, scene)
+                get_db().update_scene(scene_id, scene)
                 
                 logger.info(f"✅ Prediction created with ID: {prediction_id}")
                 logger.info("   Webhook will be called when generation completes")
@@ -1166,7 +1168,7 @@ async def generate_image_task(scene_id: str):
                 
                 # Store prediction ID in scene
                 scene.replicate_image_prediction_id = prediction_id
-                db.update_scene(scene_id, scene)
+                get_db().update_scene(scene_id, scene)
                 
                 logger.info(f"✅ Prediction created with ID: {prediction_id}")
                 logger.info("   Webhook will be called when generation completes")
@@ -1211,14 +1213,14 @@ async def generate_image_task(scene_id: str):
             scene.state = "image"
             scene.error_message = None
 
-            db.update_scene(scene_id, scene)
+            get_db().update_scene(scene_id, scene)
             print(f"[Image Generation] Successfully updated scene {scene_id} with image")
             print(f"[Image Generation] Scene state after update: {scene.state}")
             print(f"[Image Generation] Scene image_url after update: {scene.image_url}")
             print(f"[Image Generation] Scene generation_status.image after update: {scene.generation_status.image}")
             
             # Verify the scene was saved correctly
-            verified_scene = db.get_scene(scene_id)
+            verified_scene = get_db().get_scene(scene_id)
             if verified_scene:
                 print(f"[Image Generation] Verified saved scene: state={verified_scene.state}, image_url={verified_scene.image_url}, status={verified_scene.generation_status.image}")
             else:
@@ -1229,11 +1231,11 @@ async def generate_image_task(scene_id: str):
         print(f"[Image Generation] Error generating image for scene {scene_id}: {str(e)}")
         import traceback
         print(f"[Image Generation] Traceback: {traceback.format_exc()}")
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if scene:
             scene.generation_status.image = "error"
             scene.error_message = f"Image generation failed: {str(e)}"
-            db.update_scene(scene_id, scene)
+            get_db().update_scene(scene_id, scene)
             print(f"[Image Generation] Updated scene {scene_id} with error status")
 
 
@@ -1249,7 +1251,7 @@ async def generate_scene_image(
     This starts async image generation using Replicate.
     """
     try:
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1263,7 +1265,7 @@ async def generate_scene_image(
 
         # Return immediately with generating status
         scene.generation_status.image = "generating"
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
         print(f"[Image Generation] Endpoint returning with 'generating' status for scene {scene_id}")
 
         return SceneUpdateResponse(
@@ -1293,7 +1295,7 @@ async def regenerate_scene_image(
     This cancels any existing generation, clears the image, and starts new generation.
     """
     try:
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1327,7 +1329,7 @@ async def regenerate_scene_image(
         scene.trim_start_time = None
         scene.trim_end_time = None
         
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
 
         # Start image generation in background
         background_tasks.add_task(generate_image_task, scene_id)
@@ -1358,7 +1360,7 @@ async def generate_video_task(scene_id: str):
     print(f"{'='*80}")
     
     try:
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             print(f"[Video Generation] ERROR: Scene {scene_id} not found")
             return
@@ -1371,7 +1373,7 @@ async def generate_video_task(scene_id: str):
 
         # Update status to generating
         scene.generation_status.video = "generating"
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
         print(f"[Video Generation] Status updated to 'generating'")
 
         # Get Replicate token
@@ -1381,7 +1383,7 @@ async def generate_video_task(scene_id: str):
             scene.generation_status.video = "complete"
             scene.video_url = "https://commondatastorage.googleapis.com/gtv-videos-bucket/sample/BigBuckBunny.mp4"
             scene.state = "video"
-            db.update_scene(scene_id, scene)
+            get_db().update_scene(scene_id, scene)
             print(f"[Video Generation] Placeholder video set")
             return
 
@@ -1389,7 +1391,7 @@ async def generate_video_task(scene_id: str):
             print(f"[Video Generation] ERROR: No image URL found for scene {scene_id}")
             scene.generation_status.video = "error"
             scene.error_message = "Cannot generate video without an image"
-            db.update_scene(scene_id, scene)
+            get_db().update_scene(scene_id, scene)
             return
 
         # Generate video using Replicate with webhook (image-to-video model)
@@ -1471,7 +1473,7 @@ async def generate_video_task(scene_id: str):
             
             # Store prediction ID in scene
             scene.replicate_video_prediction_id = prediction_id
-            db.update_scene(scene_id, scene)
+            get_db().update_scene(scene_id, scene)
             
             print(f"[Video Generation] ✓ Prediction created with ID: {prediction_id}")
             print(f"[Video Generation]    Webhook will be called when generation completes")
@@ -1519,7 +1521,7 @@ async def generate_video_task(scene_id: str):
                 scene.generation_status.video = "complete"
                 scene.state = "video"
                 scene.error_message = None
-                db.update_scene(scene_id, scene)
+                get_db().update_scene(scene_id, scene)
                 
                 print(f"[Video Generation] ✓ Scene updated successfully")
                 print(f"[Video Generation] Status: {scene.generation_status.video}")
@@ -1537,11 +1539,11 @@ async def generate_video_task(scene_id: str):
         print(f"[Video Generation] Error: {str(e)}")
         print(f"[Video Generation] Traceback:\n{error_trace}")
         
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if scene:
             scene.generation_status.video = "error"
             scene.error_message = f"Video generation failed: {str(e)}"
-            db.update_scene(scene_id, scene)
+            get_db().update_scene(scene_id, scene)
             print(f"[Video Generation] Scene error status updated")
         
         print(f"{'='*80}\n")
@@ -1559,7 +1561,7 @@ async def generate_scene_video(
     This starts async video generation using Replicate.
     """
     try:
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1577,7 +1579,7 @@ async def generate_scene_video(
 
         # Return immediately with generating status
         scene.generation_status.video = "generating"
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
 
         return SceneUpdateResponse(
             success=True,
@@ -1606,7 +1608,7 @@ async def regenerate_scene_video(
     This cancels any existing generation, clears the video, and starts new generation.
     """
     try:
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1630,7 +1632,7 @@ async def regenerate_scene_video(
         # Reset video state
         scene.video_url = None
         scene.generation_status.video = "generating"
-        db.update_scene(scene_id, scene)
+        get_db().update_scene(scene_id, scene)
 
         # Start video generation in background
         background_tasks.add_task(generate_video_task, scene_id)
@@ -1665,7 +1667,7 @@ async def update_scene_trim(
     - trim_end_time > trim_start_time
     """
     try:
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1732,7 +1734,7 @@ async def update_scene_trim(
             scene.trim_end_time = clamped_trim_end_time
 
         # Save updated scene
-        updated_scene = db.update_scene(scene_id, scene)
+        updated_scene = get_db().update_scene(scene_id, scene)
 
         return SceneUpdateResponse(
             success=True,
@@ -1753,7 +1755,7 @@ async def update_scene_trim(
 # Server-Sent Events (SSE) Endpoint
 # ============================================================================
 
-async def scene_update_generator(storyboard_id: str) -> AsyncGenerator[str, None]:
+async def scene_update_generator(storyboard_id: str) -> AsyncGenerator[Union[str, bytes], None]:
     """
     Generate SSE events for scene updates.
 
@@ -1762,8 +1764,9 @@ async def scene_update_generator(storyboard_id: str) -> AsyncGenerator[str, None
     import logging
     logger = logging.getLogger(__name__)
     
-    # Track last known state for each scene
-    last_states = {}
+    # Track last known state for each scene as a
+    # (state, image_status, video_status, image_url, video_url, error) tuple
+    last_states: Dict[str, tuple] = {}
     
     try:
         # Send initial connection success message
@@ -1773,43 +1776,45 @@ async def scene_update_generator(storyboard_id: str) -> AsyncGenerator[str, None
         while True:
             try:
                 # Get all scenes for this storyboard
-                scenes = db.get_scenes_by_storyboard(storyboard_id)
+                scenes = await get_db().get_scenes_by_storyboard_async(storyboard_id)
 
-                # Check for changes
+                # Check for changes; all frames for this poll are written as
+                # one chunk together with the keepalive
+                frames = []
                 for scene in scenes:
-                    current_state = {
-                        "state": scene.state,
-                        "image_status": scene.generation_status.image,
-                        "video_status": scene.generation_status.video,
-                        "image_url": scene.image_url,
-                        "video_url": scene.video_url,
-                        "error": scene.error_message
+                    current_state = (
+                        scene.state,
+                        scene.generation_status.image,
+                        scene.generation_status.video,
+                        scene.image_url,
+                        scene.video_url,
+                        scene.error_message,
+                    )
+
+                    # Unchanged scenes are skipped without building a payload
+                    if last_states.get(scene.id) == current_state:
+                        continue
+
+                    # State changed, send update with BOTH statuses. The dict
+                    # has the SSESceneUpdate shape and only str/None values,
+                    # so it is encoded directly.
+                    payload = {
+                        "scene_id": scene.id,
+                        "state": current_state[0],
+                        "image_status": current_state[1],
+                        "video_status": current_state[2],
+                        "image_url": current_state[3],
+                        "video_url": current_state[4],
+                        "error": current_state[5],
                     }
+                    frames.append(b"event: scene_update\ndata: " + orjson.dumps(payload) + b"\n\n")
 
-                    # Compare with last known state
-                    last_state = last_states.get(scene.id)
-                    
-                    if last_state != current_state:
-                        # State changed, send update with BOTH statuses
-                        update = SSESceneUpdate(
-                            scene_id=scene.id,
-                            state=scene.state,
-                            image_status=scene.generation_status.image,
-                            video_status=scene.generation_status.video,
-                            image_url=scene.image_url,
-                            video_url=scene.video_url,
-                            error=scene.error_message
-                        )
-
-                        # Format as SSE event
-                        data = f"event: scene_update\ndata: {update.model_dump_json()}\n\n"
-                        yield data
-
-                        # Update last known state
-                        last_states[scene.id] = current_state
+                    # Update last known state
+                    last_states[scene.id] = current_state
 
                 # Send keepalive ping every poll cycle to prevent timeout
-                yield f": keepalive\n\n"
+                frames.append(b": keepalive\n\n")
+                yield b"".join(frames)
                 
                 # Wait before next poll
                 await asyncio.sleep(2)  # Poll every 2 seconds
@@ -1829,6 +1834,20 @@ async def scene_update_generator(storyboard_id: str) -> AsyncGenerator[str, None
         raise
 
 
+async def _gzip_event_stream(
+    events: AsyncGenerator[Union[str, bytes], None]
+) -> AsyncGenerator[bytes, None]:
+    """
+    Gzip an SSE stream, sync-flushing after every chunk so each batch of
+    events reaches the client immediately.
+    """
+    compressor = zlib.compressobj(wbits=31)  # 31 = gzip container
+    async for chunk in events:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
 @router.get("/test-sse")
 async def test_sse():
     """
@@ -1860,7 +1879,7 @@ async def test_sse():
 
 
 @router.get("/{storyboard_id}/events")
-async def scene_updates_sse(storyboard_id: str):
+async def scene_updates_sse(storyboard_id: str, request: Request):
     """
     Server-Sent Events endpoint for real-time scene updates.
 
@@ -1873,7 +1892,7 @@ async def scene_updates_sse(storyboard_id: str):
     logger.info(f"SSE connection requested for storyboard {storyboard_id}")
     
     # Verify storyboard exists
-    storyboard = db.get_storyboard(storyboard_id)
+    storyboard = get_db().get_storyboard(storyboard_id)
     if not storyboard:
         logger.warning(f"SSE connection rejected: Storyboard {storyboard_id} not found")
         raise HTTPException(
@@ -1883,16 +1902,23 @@ async def scene_updates_sse(storyboard_id: str):
 
     logger.info(f"Starting SSE stream for storyboard {storyboard_id}")
     
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",  # Disable nginx buffering
+        # CORS headers for SSE
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Methods": "GET",
+        "Access-Control-Allow-Headers": "*",
+        "Vary": "Accept-Encoding",
+    }
+    events = scene_update_generator(storyboard_id)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        events = _gzip_event_stream(events)
+
     return StreamingResponse(
-        scene_update_generator(storyboard_id),
+        events,
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-            # CORS headers for SSE
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET",
-            "Access-Control-Allow-Headers": "*",
-        }
+        headers=headers
     )
@@ -1,5 +1,5 @@
 """FastAPI router for video generation endpoints."""
-import uuid
+import secrets
 from datetime import datetime
 from typing import Dict
 from fastapi import APIRouter, HTTPException, BackgroundTasks
@@ -48,7 +48,7 @@ def _create_job(request: VideoGenerationRequest) -> str:
     Returns:
         job_id: Unique identifier for the job
     """
-    job_id = str(uuid.uuid4())
+    job_id = secrets.token_hex(16)
     now = datetime.utcnow().isoformat()
 
     # Initialize clips for each scene
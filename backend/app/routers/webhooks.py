@@ -3,9 +3,9 @@ import logging
 import hmac
 import hashlib
 from typing import Dict, Any
-from fastapi import APIRouter, Request, HTTPException, status
+from fastapi import APIRouter, Depends, Request, HTTPException, status
 from app.config import settings
-from app.firestore_database import db
+from app.firestore_database import FirestoreDatabase, get_db
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +41,7 @@ def verify_webhook_signature(payload: bytes, signature: str, secret: str) -> boo
 
 
 @router.post("/replicate")
-async def replicate_webhook(request: Request):
+async def replicate_webhook(request: Request, db: FirestoreDatabase = Depends(get_db)):
     """
     Handle Replicate prediction webhooks.
     
@@ -94,13 +94,13 @@ async def replicate_webhook(request: Request):
         )
     
     # Try to find scene by prediction ID (try both image and video)
-    scene = db.get_scene_by_image_prediction_id(prediction_id)
+    scene = await db.get_scene_by_image_prediction_id_async(prediction_id)
     if scene:
-        await _handle_image_webhook(scene, prediction_status, output, error)
+        await _handle_image_webhook(db, scene, prediction_status, output, error)
     else:
-        scene = db.get_scene_by_video_prediction_id(prediction_id)
+        scene = await db.get_scene_by_video_prediction_id_async(prediction_id)
         if scene:
-            await _handle_video_webhook(scene, prediction_status, output, error)
+            await _handle_video_webhook(db, scene, prediction_status, output, error)
         else:
             # Scene not found - might have been deleted or prediction ID doesn't match
             logger.warning(f"No scene found for prediction {prediction_id}")
@@ -111,6 +111,7 @@ async def replicate_webhook(request: Request):
 
 
 async def _handle_image_webhook(
+    db: FirestoreDatabase,
     scene: Any,
     prediction_status: str,
     output: Any,
@@ -131,7 +132,7 @@ async def _handle_image_webhook(
             logger.error(f"Unexpected output format: {type(output)}")
             scene.generation_status.image = "error"
             scene.error_message = "Unexpected output format from Replicate"
-            db.update_scene(scene.id, scene)
+            await db.update_scene_async(scene.id, scene)
             return
         
         # Persist image to Firebase Storage
@@ -171,10 +172,11 @@ async def _handle_image_webhook(
         logger.warning(f"Unexpected prediction status: {prediction_status}")
     
     # Save updated scene
-    db.update_scene(scene.id, scene)
+    await db.update_scene_async(scene.id, scene)
 
 
 async def _handle_video_webhook(
+    db: FirestoreDatabase,
     scene: Any,
     prediction_status: str,
     output: Any,
@@ -195,7 +197,7 @@ async def _handle_video_webhook(
             logger.error(f"Unexpected output format: {type(output)}")
             scene.generation_status.video = "error"
             scene.error_message = "Unexpected output format from Replicate"
-            db.update_scene(scene.id, scene)
+            await db.update_scene_async(scene.id, scene)
             return
         
         # Update scene with video URL
@@ -221,7 +223,7 @@ async def _handle_video_webhook(
         logger.warning(f"Unexpected prediction status: {prediction_status}")
     
     # Save updated scene
-    db.update_scene(scene.id, scene)
+    await db.update_scene_async(scene.id, scene)
 
 
 
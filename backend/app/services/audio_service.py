@@ -1,6 +1,6 @@
 """Audio generation service using Replicate API."""
 import asyncio
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Sequence
 import replicate
 from app.config import settings
 
@@ -34,9 +34,9 @@ class AudioGenerationService:
         self,
         mood_name: str,
         mood_description: str,
-        emotional_tone: List[str],
+        emotional_tone: Sequence[str],
         aesthetic_direction: str,
-        style_keywords: Optional[List[str]] = None
+        style_keywords: Optional[Sequence[str]] = None
     ) -> str:
         """
         Build a detailed music generation prompt from mood and creative brief data.
@@ -183,9 +183,9 @@ class AudioGenerationService:
         self,
         mood_name: str,
         mood_description: str,
-        emotional_tone: List[str],
+        emotional_tone: Sequence[str],
         aesthetic_direction: str,
-        style_keywords: Optional[List[str]] = None,
+        style_keywords: Optional[Sequence[str]] = None,
         duration: int = 30
     ) -> Dict[str, Any]:
         """
@@ -320,9 +320,9 @@ class AudioGenerationService:
         self,
         mood_name: str,
         mood_description: str,
-        emotional_tone: List[str],
+        emotional_tone: Sequence[str],
         aesthetic_direction: str,
-        style_keywords: Optional[List[str]] = None,
+        style_keywords: Optional[Sequence[str]] = None,
         duration: int = 30,
         max_retries: int = 2,
         base_delay: float = 2.0
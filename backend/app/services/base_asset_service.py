@@ -9,12 +9,13 @@ import uuid
 import logging
 import tempfile
 from pathlib import Path
-from typing import Optional, Tuple, List, TypeVar, Generic
+from typing import BinaryIO, Optional, Tuple, List, TypeVar, Generic, Union
 from datetime import datetime
 from PIL import Image
 import io
 
-from ..models.asset_models import AssetUploadResponse, AssetStatus, ImageDimensions
+from ..models.asset_models import AssetUploadResponse, AssetStatus, ImageDimensions, AssetMetadata
+from ..database import get_db
 from ..services.firebase_storage_service import get_firebase_storage_service
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,21 @@ T = TypeVar('T', bound=AssetUploadResponse)
 S = TypeVar('S', bound=AssetStatus)
 
 
+def _open_stream(file_data: Union[bytes, BinaryIO]) -> BinaryIO:
+    """Wrap raw bytes in a stream; file objects are rewound and used as-is."""
+    if isinstance(file_data, (bytes, bytearray)):
+        return io.BytesIO(file_data)
+    file_data.seek(0)
+    return file_data
+
+
+def _stream_size(stream: BinaryIO) -> int:
+    """Size of a seekable stream in bytes, leaving it rewound."""
+    size = stream.seek(0, io.SEEK_END)
+    stream.seek(0)
+    return size
+
+
 class BaseAssetService(Generic[T, S]):
     """Base service for managing assets."""
 
@@ -35,7 +51,7 @@ class BaseAssetService(Generic[T, S]):
         if not self.firebase_service:
             logger.warning(f"Firebase Storage not available for {api_prefix} - asset uploads will fail")
     
-    def validate_image(self, file_data: bytes, filename: str) -> Tuple[bool, Optional[str]]:
+    def validate_image(self, file_data: Union[bytes, BinaryIO], filename: str) -> Tuple[bool, Optional[str]]:
         """
         Validate image meets requirements.
         
@@ -46,33 +62,42 @@ class BaseAssetService(Generic[T, S]):
         - Image mode: RGB, RGBA, or L (grayscale)
         - Must be openable by PIL
         
+        Accepts raw bytes or a seekable binary file (e.g. an upload's spooled
+        temp file), which is read in place rather than copied into memory.
+        
         Returns: (is_valid, error_message)
         """
+        stream = _open_stream(file_data)
+        file_size = _stream_size(stream)
+        
         # Check file size (50MB max = 52,428,800 bytes)
         MAX_SIZE = 50 * 1024 * 1024
-        if len(file_data) == 0:
+        if file_size == 0:
             return False, "Empty file"
-        if len(file_data) > MAX_SIZE:
-            return False, f"File size must be under 50MB (got {len(file_data) / (1024*1024):.1f}MB)"
+        if file_size > MAX_SIZE:
+            return False, f"File size must be under 50MB (got {file_size / (1024*1024):.1f}MB)"
         
         # Check magic bytes for valid image format
-        if len(file_data) < 4:
+        if file_size < 4:
             return False, "File too small to be a valid image"
         
+        header = stream.read(8)
+        stream.seek(0)
         # PNG magic bytes: \x89PNG
-        is_png = file_data[:8] == b'\x89PNG\r\n\x1a\n'
+        is_png = header == b'\x89PNG\r\n\x1a\n'
         # JPEG magic bytes: \xFF\xD8 (third byte can vary: \xFF for JFIF, \xE0 for Exif, etc.)
-        is_jpeg = len(file_data) >= 2 and file_data[:2] == b'\xff\xd8'
+        is_jpeg = header[:2] == b'\xff\xd8'
         
         if not (is_png or is_jpeg):
             return False, "Only PNG and JPG images are supported (invalid file format)"
         
         # Try to open with PIL
         try:
-            img = Image.open(io.BytesIO(file_data))
+            img = Image.open(stream)
             img.verify()  # Verify it's a valid image
-            # Re-open after verify (verify closes the file)
-            img = Image.open(io.BytesIO(file_data))
+            # Re-open after verify (verify leaves the image unusable)
+            stream.seek(0)
+            img = Image.open(stream)
         except Exception as e:
             return False, f"Invalid image file: {str(e)}"
         
@@ -113,10 +138,12 @@ class BaseAssetService(Generic[T, S]):
         Returns:
             Thumbnail image (512x512)
         """
-        # Create thumbnail maintaining aspect ratio
-        # thumbnail() modifies in place but preserves aspect ratio
-        img = image.copy()
-        img.thumbnail((size, size), Image.Resampling.LANCZOS)
+        # Scale to fit within size×size, maintaining aspect ratio (never upscale).
+        # resize() returns a new image, so the full-size source is not copied
+        # first; reducing_gap shrinks by an integer factor before LANCZOS.
+        scale = min(size / image.width, size / image.height, 1.0)
+        fit = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        img = image.resize(fit, Image.Resampling.LANCZOS, reducing_gap=2.0)
         
         # Create square canvas with appropriate background
         if img.mode == 'RGBA':
@@ -140,13 +167,16 @@ class BaseAssetService(Generic[T, S]):
     
     def save_asset(
         self,
-        file_data: bytes,
+        file_data: Union[bytes, BinaryIO],
         filename: str,
         user_id: Optional[str] = None
     ) -> T:
         """
         Save asset with thumbnail generation.
 
+        file_data may be raw bytes or a seekable binary file such as
+        UploadFile.file, so uploads are processed without a full in-memory copy.
+
         Steps:
         1. Validate image
         2. Generate UUID asset_id
@@ -157,13 +187,16 @@ class BaseAssetService(Generic[T, S]):
         if not self.firebase_service:
             raise ValueError("Firebase Storage not configured")
 
+        stream = _open_stream(file_data)
+
         # Validate
-        is_valid, error = self.validate_image(file_data, filename)
+        is_valid, error = self.validate_image(stream, filename)
         if not is_valid:
             raise ValueError(error)
 
         # Load image
-        img = Image.open(io.BytesIO(file_data))
+        file_size = _stream_size(stream)
+        img = Image.open(stream)
 
         # Save original format before any conversions (PIL loses this after convert)
         original_format = img.format
@@ -196,8 +229,9 @@ class BaseAssetService(Generic[T, S]):
 
             # Save original
             if img_format == 'png':
-                # Save PNG with full quality, preserve alpha
-                img.save(original_temp_path, 'PNG', optimize=False)
+                # Save PNG losslessly, preserve alpha; optimize trades
+                # upload CPU (off the event loop) for a smaller stored file
+                img.save(original_temp_path, 'PNG', optimize=True)
             else:
                 # Convert RGBA to RGB for JPEG (JPEG doesn't support transparency)
                 if img.mode == 'RGBA':
@@ -207,7 +241,7 @@ class BaseAssetService(Generic[T, S]):
                     img = rgb_img
                 elif img.mode == 'L':
                     img = img.convert('RGB')
-                img.save(original_temp_path, 'JPEG', quality=95, optimize=True)
+                img.save(original_temp_path, 'JPEG', quality=95, optimize=True, progressive=True)
 
             # Upload original to Firebase
             print(f"[Asset Upload] Uploading {filename} to Firebase Storage...")
@@ -241,7 +275,7 @@ class BaseAssetService(Generic[T, S]):
                     rgb_thumb = Image.new('RGB', thumb.size, (255, 255, 255))
                     rgb_thumb.paste(thumb, mask=thumb.split()[3])
                     thumb = rgb_thumb
-                thumb.save(thumb_temp_path, 'JPEG', quality=90, optimize=True)
+                thumb.save(thumb_temp_path, 'JPEG', quality=90, optimize=True, progressive=True)
 
             # Upload thumbnail to Firebase
             print(f"[Asset Upload] Uploading thumbnail for {filename} to Firebase Storage...")
@@ -262,12 +296,10 @@ class BaseAssetService(Generic[T, S]):
 
         # Extract metadata
         width, height = img.size
-        file_size = len(file_data)
         has_alpha = img.mode == 'RGBA'
         uploaded_at = datetime.utcnow().isoformat()
 
         # Save asset metadata to in-memory database
-        from app.database import db
         asset_metadata = {
             'asset_id': asset_id,
             'asset_type': self.api_prefix,
@@ -285,11 +317,11 @@ class BaseAssetService(Generic[T, S]):
             'status': 'active',
             'user_id': user_id
         }
-        db.create_asset(asset_id, asset_metadata)
+        get_db().create_asset(asset_id, asset_metadata)
         logger.info(f"Saved asset metadata to database: {self.api_prefix}/{asset_id}")
 
         # Return response using the specific response class
-        return self.response_class(
+        return self.response_class.model_construct(
             asset_id=asset_id,
             filename=filename,
             url=public_url,
@@ -297,19 +329,42 @@ class BaseAssetService(Generic[T, S]):
             public_url=public_url,
             public_thumbnail_url=public_thumbnail_url,
             size=file_size,
-            dimensions=ImageDimensions(width=width, height=height),
+            dimensions=ImageDimensions.model_construct(width=width, height=height),
             format=img_format,
             has_alpha=has_alpha,
             uploaded_at=uploaded_at
         )
     
+    def _status_from_data(self, asset_data: dict) -> S:
+        """
+        Build a status instance from a stored asset record.
+
+        Records are written by save_asset, so the nested models are built
+        with model_construct instead of being validated again on every read.
+        """
+        return self.status_class.model_construct(
+            asset_id=asset_data['asset_id'],
+            status=asset_data.get('status', 'active'),
+            url=asset_data['url'],
+            thumbnail_url=asset_data['thumbnail_url'],
+            public_url=asset_data.get('public_url'),
+            public_thumbnail_url=asset_data.get('public_thumbnail_url'),
+            dimensions=ImageDimensions.model_construct(width=asset_data['width'], height=asset_data['height']),
+            format=asset_data['format'],
+            has_alpha=asset_data['has_alpha'],
+            metadata=AssetMetadata.model_construct(
+                filename=asset_data['filename'],
+                size=asset_data['size'],
+                uploaded_at=asset_data['uploaded_at']
+            )
+        )
+
     def get_asset(self, asset_id: str, user_id: Optional[str] = None) -> Optional[S]:
         """
         Get asset metadata and URLs from in-memory database.
         Optionally verify ownership by user_id.
         """
-        from app.database import db
-        asset_data = db.get_asset(asset_id)
+        asset_data = get_db().get_asset(asset_id)
 
         if not asset_data:
             logger.warning(f"Asset not found: {asset_id}")
@@ -321,70 +376,41 @@ class BaseAssetService(Generic[T, S]):
             return None
 
         # Convert to status class
-        return self.status_class(
-            asset_id=asset_data['asset_id'],
-            status=asset_data.get('status', 'active'),
-            url=asset_data['url'],
-            thumbnail_url=asset_data['thumbnail_url'],
-            public_url=asset_data.get('public_url'),
-            public_thumbnail_url=asset_data.get('public_thumbnail_url'),
-            dimensions=ImageDimensions(width=asset_data['width'], height=asset_data['height']),
-            format=asset_data['format'],
-            has_alpha=asset_data['has_alpha'],
-            metadata={
-                'filename': asset_data['filename'],
-                'size': asset_data['size'],
-                'uploaded_at': asset_data['uploaded_at']
-            }
-        )
+        return self._status_from_data(asset_data)
+
+    def owns_asset(self, asset_id: str, user_id: str) -> bool:
+        """
+        Whether the asset exists and belongs to user_id.
+        
+        Cheaper than get_asset for callers that only need the ownership
+        check, since no status model is built from the cached record.
+        """
+        asset_data = get_db().get_asset(asset_id)
+        return bool(asset_data) and asset_data.get('user_id') == user_id
 
     def list_assets(self, user_id: Optional[str] = None) -> List[S]:
         """
         List all assets of this type from Firestore database.
         Optionally filter by user_id (recommended for performance).
         """
-        from app.database import db
         
         # Pass user_id to database for efficient querying
         # This will query users/{user_id}/assets/ directly if user_id is provided
-        assets_data = db.list_assets_by_type(self.api_prefix, user_id=user_id)
+        assets_data = get_db().list_assets_by_type(self.api_prefix, user_id=user_id)
 
         logger.info(f"Found {len(assets_data)} assets of type {self.api_prefix} for user {user_id}")
 
-        # Convert to status class instances
-        assets = []
-        for asset_data in assets_data:
-            try:
-                asset = self.status_class(
-                    asset_id=asset_data['asset_id'],
-                    status=asset_data.get('status', 'active'),
-                    url=asset_data['url'],
-                    thumbnail_url=asset_data['thumbnail_url'],
-                    public_url=asset_data.get('public_url'),
-                    public_thumbnail_url=asset_data.get('public_thumbnail_url'),
-                    dimensions=ImageDimensions(width=asset_data['width'], height=asset_data['height']),
-                    format=asset_data['format'],
-                    has_alpha=asset_data['has_alpha'],
-                    metadata={
-                        'filename': asset_data['filename'],
-                        'size': asset_data['size'],
-                        'uploaded_at': asset_data['uploaded_at']
-                    }
-                )
-                assets.append(asset)
-            except Exception as e:
-                logger.error(f"Error converting asset data: {e}", exc_info=True)
-                continue
-
-        return assets
+        # Every record of this asset_type was written by save_asset with the
+        # full field set, so conversion is unvalidated and can't fail per
+        # record (see _status_from_data)
+        return [self._status_from_data(asset_data) for asset_data in assets_data]
 
     def delete_asset(self, asset_id: str, user_id: Optional[str] = None) -> bool:
         """
         Remove asset from in-memory database.
         Note: This does not delete the file from Firebase Storage.
         """
-        from app.database import db
-        deleted = db.delete_asset(asset_id)
+        deleted = get_db().delete_asset(asset_id)
 
         if deleted:
             logger.info(f"Deleted asset from database: {asset_id}")
@@ -394,6 +420,17 @@ class BaseAssetService(Generic[T, S]):
 
         return deleted
 
+    def resolve_owned_url(self, asset_id: str, user_id: str, thumbnail: bool = False) -> Optional[str]:
+        """
+        Firebase Storage URL of the asset's image (or thumbnail) if user_id
+        owns the asset, else None. Serves the file endpoints with a single
+        record lookup.
+        """
+        asset_data = get_db().get_asset(asset_id)
+        if not asset_data or asset_data.get('user_id') != user_id:
+            return None
+        return asset_data.get('public_thumbnail_url' if thumbnail else 'public_url')
+
     def get_asset_path(self, asset_id: str, thumbnail: bool = False) -> Optional[Path]:
         """
         Get path to asset image file.
@@ -0,0 +1,121 @@
+"""
+Composition Job Store
+
+Holds composition job state. With REDIS_URL configured, each job is a Redis
+hash (comp:job:{job_id}) so every worker process can serve status and
+downloads for jobs another worker created; otherwise jobs live in this
+process only. The Redis client is blocking, so its calls run in a worker
+thread instead of on the event loop.
+
+Only job state is shared. A finished job's file_path is on the host named
+by file_host, so with several hosts the composition output directory must
+be shared storage, or downloads must be routed to the rendering host;
+/download rejects jobs whose file lives on another host.
+"""
+
+import asyncio
+import logging
+from dataclasses import asdict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from app.config import settings
+from app.models.composition_models import CompositionJobState, CompositionStatus
+from app.utils.redis_client import connect_redis
+
+logger = logging.getLogger(__name__)
+
+# How long a job (and so its download link) is kept in Redis
+_JOB_TTL_SECONDS = 24 * 60 * 60
+
+# Sorted set of job ids scored by created_at, for listing
+_JOB_INDEX_KEY = "comp:jobs"
+
+# HSET only if the job hash still exists, in one atomic step, so an update
+# racing with expiry never leaves a partial hash behind
+_UPDATE_IF_EXISTS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('HSET', KEYS[1], unpack(ARGV))
+end
+return 0
+"""
+
+
+def _job_key(job_id: str) -> str:
+    return f"comp:job:{job_id}"
+
+
+def _encode_fields(fields: Dict[str, Any]) -> Dict[str, bytes]:
+    """Encode hash values as JSON so None, ints and floats keep their types."""
+    return {name: orjson.dumps(value) for name, value in fields.items()}
+
+
+def _decode_job(raw: Dict[bytes, bytes]) -> CompositionJobState:
+    data = {name.decode(): orjson.loads(value) for name, value in raw.items()}
+    data["status"] = CompositionStatus(data["status"])
+    return CompositionJobState(**data)
+
+
+class CompositionJobStore:
+    """Composition jobs in Redis when available, else in a per-process dict."""
+
+    def __init__(self, redis_client=None):
+        self._redis = redis_client
+        self._local: Dict[str, CompositionJobState] = {}
+        self._update_if_exists = (
+            redis_client.register_script(_UPDATE_IF_EXISTS_SCRIPT) if redis_client is not None else None
+        )
+
+    async def get(self, job_id: str) -> Optional[CompositionJobState]:
+        """Get a job, or None if it is unknown (or expired)."""
+        if self._redis is None:
+            return self._local.get(job_id)
+        raw = await asyncio.to_thread(self._redis.hgetall, _job_key(job_id))
+        return _decode_job(raw) if raw else None
+
+    async def set(self, job: CompositionJobState) -> None:
+        """Store a new job, replacing any job with the same id."""
+        if self._redis is None:
+            self._local[job.job_id] = job
+            return
+        key = _job_key(job.job_id)
+        expired_before = job.created_at - _JOB_TTL_SECONDS * 1000
+        pipe = self._redis.pipeline()
+        pipe.delete(key)
+        pipe.hset(key, mapping=_encode_fields(asdict(job)))
+        pipe.expire(key, _JOB_TTL_SECONDS)
+        pipe.zadd(_JOB_INDEX_KEY, {job.job_id: job.created_at})
+        pipe.zremrangebyscore(_JOB_INDEX_KEY, "-inf", expired_before)
+        await asyncio.to_thread(pipe.execute)
+
+    async def update(self, job_id: str, **fields: Any) -> None:
+        """Set fields on an existing job; unknown jobs are ignored."""
+        if self._redis is None:
+            job = self._local.get(job_id)
+            if job is not None:
+                for name, value in fields.items():
+                    setattr(job, name, value)
+            return
+        args = [part for item in _encode_fields(fields).items() for part in item]
+        await asyncio.to_thread(self._update_if_exists, keys=[_job_key(job_id)], args=args)
+
+    async def list(self) -> List[CompositionJobState]:
+        """All known jobs, newest first."""
+        if self._redis is None:
+            return sorted(self._local.values(), key=lambda job: job.created_at, reverse=True)
+        return await asyncio.to_thread(self._list_from_redis)
+
+    def _list_from_redis(self) -> List[CompositionJobState]:
+        job_ids = self._redis.zrevrange(_JOB_INDEX_KEY, 0, -1)
+        pipe = self._redis.pipeline(transaction=False)
+        for job_id in job_ids:
+            pipe.hgetall(_job_key(job_id.decode()))
+        return [_decode_job(raw) for raw in pipe.execute() if raw]
+
+
+@lru_cache(maxsize=1)
+def get_composition_job_store() -> CompositionJobStore:
+    """Get the process-wide job store, connecting to Redis on first use."""
+    return CompositionJobStore(connect_redis(settings.REDIS_URL, "composition job store"))
@@ -11,6 +11,17 @@ from datetime import datetime
 from app.config import settings
 
 
+def _progress_duration(progress: bytes) -> Optional[float]:
+    """Seconds of output written, from the last out_time in `-progress` output."""
+    duration_us = None
+    for line in progress.splitlines():
+        key, _, value = line.partition(b"=")
+        # out_time_ms is also in microseconds (a long-standing FFmpeg misnomer)
+        if key in (b"out_time_us", b"out_time_ms") and value.strip().isdigit():
+            duration_us = int(value)
+    return duration_us / 1_000_000 if duration_us is not None else None
+
+
 class FFmpegCompositionService:
     """Service for composing final videos using FFmpeg."""
 
@@ -317,7 +328,7 @@ class FFmpegCompositionService:
         output_filename: Optional[str] = None,
         include_crossfade: bool = True,
         target_bitrate: Optional[str] = None
-    ) -> Optional[Path]:
+    ) -> Optional[Tuple[Path, float]]:
         """
         Compose final video from clips with audio and transitions.
 
@@ -329,7 +340,9 @@ class FFmpegCompositionService:
             target_bitrate: Optional target video bitrate (e.g., "2M", "3M")
 
         Returns:
-            Path to composed video or None if failed
+            (path to composed video, duration in seconds) or None if failed.
+            The duration is what FFmpeg reports encoding, so callers need
+            not probe the output again.
         """
         print("\n🎬 Starting video composition...")
 
@@ -365,34 +378,39 @@ class FFmpegCompositionService:
 
             # Compose video based on whether crossfade is needed
             if include_crossfade and len(video_paths) > 1:
-                composed_path = await self._compose_with_crossfade(
+                composed = await self._compose_with_crossfade(
                     video_paths, clip_durations, output_path, target_bitrate,
                     width=detected_width, height=detected_height
                 )
             else:
-                composed_path = await self._compose_simple_concat(
+                composed = await self._compose_simple_concat(
                     video_paths, output_path, target_bitrate,
                     width=detected_width, height=detected_height
                 )
 
-            if not composed_path or not composed_path.exists():
+            if not composed or not composed[0].exists():
                 print("✗ Video composition failed")
                 return None
+            composed_path, encoded_duration = composed
 
             # Add audio if provided
             if audio_path and audio_path.exists():
                 print("\n🎵 Adding background music...")
                 final_path = output_path.parent / f"final_{output_path.name}"
-                success = await self._add_audio_to_video(
+                mixed = await self._add_audio_to_video(
                     composed_path, audio_path, final_path, final_duration
                 )
-                if success and final_path.exists():
+                if mixed and final_path.exists():
                     # Remove intermediate file
                     composed_path.unlink()
-                    composed_path = final_path
+                    composed_path, encoded_duration = mixed
                 else:
                     print("⚠ Warning: Audio mixing failed, using video without audio")
 
+            # Fall back to the planned duration if FFmpeg didn't report one
+            if encoded_duration is not None:
+                final_duration = encoded_duration
+
             # Check file size
             file_size_mb = composed_path.stat().st_size / (1024 * 1024)
             print(f"\n✅ Video composition complete!")
@@ -404,7 +422,7 @@ class FFmpegCompositionService:
             if file_size_mb > self.TARGET_MAX_SIZE_MB:
                 print(f"⚠ Warning: File size ({file_size_mb:.2f} MB) exceeds target ({self.TARGET_MAX_SIZE_MB} MB)")
 
-            return composed_path
+            return composed_path, final_duration
 
         except Exception as e:
             print(f"✗ Video composition failed: {str(e)}")
@@ -412,6 +430,20 @@ class FFmpegCompositionService:
             traceback.print_exc()
             return None
 
+    async def _run_with_progress(self, output) -> Optional[float]:
+        """
+        Run an FFmpeg output stream in a worker thread.
+
+        Returns:
+            Duration of the encoded output in seconds, read from FFmpeg's
+            -progress report, or None if it did not report one
+        """
+        stdout, _ = await asyncio.to_thread(
+            lambda: output.global_args('-progress', 'pipe:1', '-nostats')
+            .run(capture_stdout=True, capture_stderr=True)
+        )
+        return _progress_duration(stdout)
+
     async def _compose_simple_concat(
         self,
         video_paths: List[Path],
@@ -419,7 +451,7 @@ class FFmpegCompositionService:
         target_bitrate: Optional[str] = None,
         width: Optional[int] = None,
         height: Optional[int] = None
-    ) -> Optional[Path]:
+    ) -> Optional[Tuple[Path, Optional[float]]]:
         """
         Concatenate videos without transitions using concat demuxer.
 
@@ -431,7 +463,8 @@ class FFmpegCompositionService:
             height: Target video height (auto-detected if not provided)
 
         Returns:
-            Path to output file or None if failed
+            (output path, encoded duration in seconds or None if FFmpeg did
+            not report it), or None if failed
         """
         try:
             # Use provided resolution or defaults
@@ -454,8 +487,8 @@ class FFmpegCompositionService:
             # Use concat demuxer for simple concatenation
             if has_audio:
                 # Clips have audio
-                await asyncio.to_thread(
-                    lambda: (
+                duration = await self._run_with_progress(
+                    (
                         ffmpeg
                         .input(str(list_file), format='concat', safe=0)
                         .output(
@@ -470,13 +503,12 @@ class FFmpegCompositionService:
                             pix_fmt='yuv420p'
                         )
                         .overwrite_output()
-                        .run(capture_stdout=True, capture_stderr=True)
                     )
                 )
             else:
                 # Video-only clips (no audio)
-                await asyncio.to_thread(
-                    lambda: (
+                duration = await self._run_with_progress(
+                    (
                         ffmpeg
                         .input(str(list_file), format='concat', safe=0)
                         .output(
@@ -489,12 +521,11 @@ class FFmpegCompositionService:
                             pix_fmt='yuv420p'
                         )
                         .overwrite_output()
-                        .run(capture_stdout=True, capture_stderr=True)
                     )
                 )
 
             print("✓ Concatenation complete")
-            return output_path
+            return output_path, duration
 
         except ffmpeg.Error as e:
             print(f"✗ FFmpeg error during concatenation:")
@@ -512,7 +543,7 @@ class FFmpegCompositionService:
         target_bitrate: Optional[str] = None,
         width: Optional[int] = None,
         height: Optional[int] = None
-    ) -> Optional[Path]:
+    ) -> Optional[Tuple[Path, Optional[float]]]:
         """
         Compose video with crossfade transitions between clips.
 
@@ -525,7 +556,8 @@ class FFmpegCompositionService:
             height: Target video height (auto-detected if not provided)
 
         Returns:
-            Path to output file or None if failed
+            (output path, encoded duration in seconds or None if FFmpeg did
+            not report it), or None if failed
         """
         try:
             print("🎞️  Composing with crossfade transitions...")
@@ -624,12 +656,10 @@ class FFmpegCompositionService:
                 ).overwrite_output()
 
             # Run FFmpeg
-            await asyncio.to_thread(
-                lambda: output.run(capture_stdout=True, capture_stderr=True)
-            )
+            duration = await self._run_with_progress(output)
 
             print("✓ Crossfade composition complete")
-            return output_path
+            return output_path, duration
 
         except ffmpeg.Error as e:
             print(f"✗ FFmpeg error during crossfade:")
@@ -645,7 +675,7 @@ class FFmpegCompositionService:
         audio_path: Path,
         output_path: Path,
         target_duration: float
-    ) -> bool:
+    ) -> Optional[Tuple[Path, Optional[float]]]:
         """
         Add background audio to video with proper synchronization.
 
@@ -656,7 +686,8 @@ class FFmpegCompositionService:
             target_duration: Target duration in seconds
 
         Returns:
-            True if successful, False otherwise
+            (output path, encoded duration in seconds or None if FFmpeg did
+            not report it), or None if failed
         """
         try:
             # Load video and audio
@@ -686,20 +717,18 @@ class FFmpegCompositionService:
             )
 
             # Run FFmpeg
-            await asyncio.to_thread(
-                lambda: output.run(capture_stdout=True, capture_stderr=True)
-            )
+            duration = await self._run_with_progress(output)
 
             print("✓ Audio added successfully")
-            return True
+            return output_path, duration
 
         except ffmpeg.Error as e:
             print(f"✗ FFmpeg error adding audio:")
             print(e.stderr.decode() if e.stderr else str(e))
-            return False
+            return None
         except Exception as e:
             print(f"✗ Error adding audio: {str(e)}")
-            return False
+            return None
 
     def cleanup_job_files(self, job_dir: Path):
         """
@@ -721,7 +750,8 @@ class FFmpegCompositionService:
     async def optimize_file_size(
         self,
         video_path: Path,
-        target_size_mb: float = TARGET_MAX_SIZE_MB
+        target_size_mb: float = TARGET_MAX_SIZE_MB,
+        duration_seconds: Optional[float] = None
     ) -> Optional[Path]:
         """
         Optimize video file size by adjusting bitrate.
@@ -729,6 +759,7 @@ class FFmpegCompositionService:
         Args:
             video_path: Path to video file
             target_size_mb: Target size in MB
+            duration_seconds: Video duration if already known (probed otherwise)
 
         Returns:
             Path to optimized video or None if failed
@@ -743,8 +774,11 @@ class FFmpegCompositionService:
 
             # Calculate required bitrate reduction
             size_ratio = target_size_mb / current_size_mb
-            probe = ffmpeg.probe(str(video_path))
-            duration = float(probe['format']['duration'])
+            if duration_seconds is not None:
+                duration = duration_seconds
+            else:
+                probe = ffmpeg.probe(str(video_path))
+                duration = float(probe['format']['duration'])
 
             # Calculate new bitrate (80% of theoretical to account for overhead)
             target_bitrate_kbps = int((target_size_mb * 8 * 1024) / duration * 0.8)
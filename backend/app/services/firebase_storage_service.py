@@ -23,27 +23,23 @@ def _initialize_firebase():
         return True
     
     try:
-        import firebase_admin
-        from firebase_admin import credentials, storage
+        from firebase_admin import storage
         from app.config import settings
+        from app.firebase_init import get_firebase_app
         
-        # Check if credentials file exists
-        creds_path = Path(settings.FIREBASE_CREDENTIALS_PATH)
-        if not creds_path.exists():
-            logger.warning(f"Firebase credentials file not found at {creds_path}")
+        # Shared app (raises FileNotFoundError if the key is missing); the
+        # bucket is named explicitly since the app may have been initialized
+        # (by Firestore or auth) without a storageBucket
+        try:
+            firebase_app = get_firebase_app()
+        except FileNotFoundError as e:
+            logger.warning(str(e))
             return False
         
-        # Initialize Firebase Admin SDK
-        cred = credentials.Certificate(str(creds_path))
-        
-        # Get bucket name from settings or credentials
+        # Get bucket name from settings or the project the app was loaded for
         bucket_name = settings.FIREBASE_STORAGE_BUCKET
         if not bucket_name:
-            # Try to get project_id from credentials and construct default bucket name
-            import json
-            with open(creds_path, 'r') as f:
-                creds_data = json.load(f)
-            project_id = creds_data.get('project_id', '')
+            project_id = firebase_app.project_id
             if project_id:
                 # Try new format first (.firebasestorage.app), then fall back to old format (.appspot.com)
                 # Newer Firebase projects use .firebasestorage.app
@@ -53,18 +49,8 @@ def _initialize_firebase():
             logger.error("Firebase storage bucket name could not be determined")
             return False
 
-        # Initialize app with storage bucket (or use existing app)
-        try:
-            _firebase_app = firebase_admin.get_app()
-            logger.info("Using existing Firebase app instance")
-            # When using existing app, must specify bucket name explicitly
-            _storage_bucket = storage.bucket(bucket_name)
-        except ValueError:
-            # App doesn't exist yet, initialize it
-            _firebase_app = firebase_admin.initialize_app(cred, {
-                'storageBucket': bucket_name
-            })
-            _storage_bucket = storage.bucket()
+        _firebase_app = firebase_app
+        _storage_bucket = storage.bucket(bucket_name, app=_firebase_app)
         
         logger.info(f"Firebase Storage initialized with bucket: {bucket_name}")
         print(f"[Firebase Storage] ✓ Initialized with bucket: {bucket_name}")
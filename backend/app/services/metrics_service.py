@@ -1,11 +1,31 @@
 """Metrics tracking service for composite generation."""
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 import json
 from pathlib import Path
 
 
+def _initial_metrics() -> Dict:
+    """Fresh, zeroed metrics state."""
+    return {
+        "kontext": {
+            "total_calls": 0,
+            "successful_calls": 0,
+            "failed_calls": 0,
+            "total_time_seconds": 0.0
+        },
+        "pil": {
+            "total_calls": 0,
+            "successful_calls": 0,
+            "failed_calls": 0,
+            "total_time_seconds": 0.0
+        },
+        "fallback_events": 0,
+        "daily_generations": defaultdict(int)  # date -> count
+    }
+
+
 class CompositeMetrics:
     """
     Track metrics for composite generation.
@@ -19,22 +39,9 @@ class CompositeMetrics:
     """
     
     def __init__(self):
-        self.metrics: Dict = {
-            "kontext": {
-                "total_calls": 0,
-                "successful_calls": 0,
-                "failed_calls": 0,
-                "total_time_seconds": 0.0
-            },
-            "pil": {
-                "total_calls": 0,
-                "successful_calls": 0,
-                "failed_calls": 0,
-                "total_time_seconds": 0.0
-            },
-            "fallback_events": 0,
-            "daily_generations": defaultdict(int)  # date -> count
-        }
+        self.metrics: Dict = _initial_metrics()
+        # (date, stats) from the last get_stats(); dropped on every write
+        self._stats_cache: Optional[Tuple[str, Dict]] = None
         
         self.metrics_file = Path("logs/composite_metrics.json")
         self.load_metrics()
@@ -93,12 +100,26 @@ class CompositeMetrics:
         
         return self.metrics["daily_generations"].get(date, 0)
     
+    def get_daily_counts(self, dates: List[str]) -> Dict[str, int]:
+        """Get generation counts for several dates in one call."""
+        daily = self.metrics["daily_generations"]
+        return {date: daily.get(date, 0) for date in dates}
+    
     def get_stats(self) -> Dict:
-        """Get summary statistics."""
+        """
+        Get summary statistics.
+        
+        The result is reused until the next recorded call or the date
+        changes, so dashboards polling the admin endpoints don't recompute it.
+        """
+        today = datetime.now().date().isoformat()
+        if self._stats_cache is not None and self._stats_cache[0] == today:
+            return self._stats_cache[1]
+        
         kontext = self.metrics["kontext"]
         pil = self.metrics["pil"]
         
-        return {
+        stats = {
             "kontext": {
                 "total_calls": kontext["total_calls"],
                 "success_rate": (
@@ -125,8 +146,10 @@ class CompositeMetrics:
                 self.metrics["fallback_events"] / kontext["total_calls"]
                 if kontext["total_calls"] > 0 else 0
             ),
-            "today_generations": self.get_daily_count()
+            "today_generations": self.get_daily_count(today)
         }
+        self._stats_cache = (today, stats)
+        return stats
     
     def check_daily_generation_alert(self, threshold: int = 1000) -> bool:
         """Check if daily generation count exceeds threshold."""
@@ -138,8 +161,33 @@ class CompositeMetrics:
         
         return False
     
+    def is_kontext_healthy(self, min_success_pct: int = 95, min_calls: int = 10) -> bool:
+        """
+        Whether the Kontext success rate is at least min_success_pct percent.
+        
+        Compared on the raw integer counters; too few calls counts as healthy.
+        """
+        kontext = self.metrics["kontext"]
+        calls = kontext["total_calls"]
+        if calls <= min_calls:
+            return True
+        return kontext["successful_calls"] * 100 >= calls * min_success_pct
+    
+    def is_fallback_rate_healthy(self, max_fallback_pct: int = 10, min_calls: int = 10) -> bool:
+        """Whether fallbacks are at most max_fallback_pct percent of Kontext calls."""
+        calls = self.metrics["kontext"]["total_calls"]
+        if calls <= min_calls:
+            return True
+        return self.metrics["fallback_events"] * 100 <= calls * max_fallback_pct
+    
+    def reset(self):
+        """Reset all metrics to their initial state and persist it."""
+        self.metrics = _initial_metrics()
+        self.save_metrics()
+    
     def save_metrics(self):
         """Save metrics to disk."""
+        self._stats_cache = None
         self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Convert defaultdict to dict for JSON serialization
@@ -164,6 +212,7 @@ class CompositeMetrics:
                         int,
                         loaded.get("daily_generations", {})
                     )
+                    self._stats_cache = None
             except Exception as e:
                 print(f"[Metrics] Failed to load metrics: {e}")
 
@@ -1,6 +1,6 @@
 """Replicate API service for image and video generation."""
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 import replicate
 import requests
 import tempfile
@@ -231,8 +231,8 @@ class ReplicateImageService:
         self,
         mood_name: str,
         mood_description: str,
-        style_keywords: List[str],
-        color_palette: List[str],
+        style_keywords: Sequence[str],
+        color_palette: Sequence[str],
         aesthetic_direction: str,
         product_name: Optional[str] = None
     ) -> str:
@@ -361,8 +361,8 @@ class ReplicateImageService:
         self,
         scene_description: str,
         scene_style_prompt: str,
-        mood_style_keywords: List[str],
-        mood_color_palette: List[str],
+        mood_style_keywords: Sequence[str],
+        mood_color_palette: Sequence[str],
         mood_aesthetic_direction: str
     ) -> str:
         """
@@ -426,8 +426,8 @@ class ReplicateImageService:
     async def generate_scene_seed_images(
         self,
         scenes: List[Dict[str, Any]],
-        mood_style_keywords: List[str],
-        mood_color_palette: List[str],
+        mood_style_keywords: Sequence[str],
+        mood_color_palette: Sequence[str],
         mood_aesthetic_direction: str,
         width: int = 1920,
         height: int = 1080
@@ -6,11 +6,11 @@ from app.models.storyboard_models import (
     SceneGenerationStatus,
     StoryboardInitializeRequest,
 )
-from app.database import db
+from app.database import get_db
 from app.config import settings
+from app.utils.uuidpool import next_uuid_str
 from openai import OpenAI
 import json
-import uuid
 
 
 class StoryboardService:
@@ -27,9 +27,9 @@ class StoryboardService:
         
         return f"""Product: {creative_brief.get('product_name', 'Unknown')}
 Target Audience: {creative_brief.get('target_audience', 'General')}
-Emotional Tone: {', '.join(creative_brief.get('emotional_tone', [])) if isinstance(creative_brief.get('emotional_tone'), list) else creative_brief.get('emotional_tone', 'N/A')}
-Visual Style Keywords: {', '.join(creative_brief.get('visual_style_keywords', [])) if isinstance(creative_brief.get('visual_style_keywords'), list) else creative_brief.get('visual_style_keywords', 'N/A')}
-Key Messages: {', '.join(creative_brief.get('key_messages', [])) if isinstance(creative_brief.get('key_messages'), list) else creative_brief.get('key_messages', 'N/A')}"""
+Emotional Tone: {', '.join(creative_brief.get('emotional_tone', [])) if isinstance(creative_brief.get('emotional_tone'), (list, tuple)) else creative_brief.get('emotional_tone', 'N/A')}
+Visual Style Keywords: {', '.join(creative_brief.get('visual_style_keywords', [])) if isinstance(creative_brief.get('visual_style_keywords'), (list, tuple)) else creative_brief.get('visual_style_keywords', 'N/A')}
+Key Messages: {', '.join(creative_brief.get('key_messages', [])) if isinstance(creative_brief.get('key_messages'), (list, tuple)) else creative_brief.get('key_messages', 'N/A')}"""
 
     async def generate_scene_texts(
         self,
@@ -183,7 +183,7 @@ Example format:
         creative_brief_str = self._format_creative_brief(creative_brief_dict)
 
         # Generate storyboard ID first (needed for scenes)
-        storyboard_id = str(uuid.uuid4())
+        storyboard_id = next_uuid_str()
 
         # Don't set assets by default - let users toggle them per scene
         # Assets are available from project but not automatically assigned
@@ -219,9 +219,7 @@ Example format:
         )
 
         # Save to database
-        db.create_storyboard(storyboard)
-        for scene in scenes:
-            db.create_scene(scene)
+        get_db().create_storyboard_with_scenes(storyboard, scenes)
 
         return storyboard, scenes
 
@@ -230,12 +228,12 @@ Example format:
         storyboard_id: str
     ) -> tuple[Storyboard, List[StoryboardScene]]:
         """Get storyboard with all its scenes in order."""
-        storyboard = db.get_storyboard(storyboard_id)
+        storyboard = get_db().get_storyboard(storyboard_id)
         if not storyboard:
             raise ValueError(f"Storyboard {storyboard_id} not found")
 
         # Get all scenes
-        all_scenes = db.get_scenes_by_storyboard(storyboard_id)
+        all_scenes = get_db().get_scenes_by_storyboard(storyboard_id)
 
         # Order scenes according to scene_order
         scenes_by_id = {scene.id: scene for scene in all_scenes}
@@ -249,7 +247,7 @@ Example format:
         new_text: str
     ) -> StoryboardScene:
         """Update scene text manually."""
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise ValueError(f"Scene {scene_id} not found")
 
@@ -263,7 +261,7 @@ Example format:
         scene.error_message = None
 
         # Save
-        updated_scene = db.update_scene(scene_id, scene)
+        updated_scene = get_db().update_scene(scene_id, scene)
         return updated_scene
 
     async def regenerate_scene_text(
@@ -272,12 +270,12 @@ Example format:
         creative_brief: Dict[str, Any]
     ) -> StoryboardScene:
         """Regenerate scene text using AI."""
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise ValueError(f"Scene {scene_id} not found")
 
         # Get storyboard for context
-        storyboard = db.get_storyboard(scene.storyboard_id)
+        storyboard = get_db().get_storyboard(scene.storyboard_id)
         if not storyboard:
             raise ValueError(f"Storyboard {scene.storyboard_id} not found")
 
@@ -306,7 +304,7 @@ Example format:
             scene.error_message = None
 
         # Save
-        updated_scene = db.update_scene(scene_id, scene)
+        updated_scene = get_db().update_scene(scene_id, scene)
         return updated_scene
 
     async def update_scene_duration(
@@ -315,7 +313,7 @@ Example format:
         new_duration: float
     ) -> StoryboardScene:
         """Update scene video duration."""
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene:
             raise ValueError(f"Scene {scene_id} not found")
 
@@ -329,12 +327,12 @@ Example format:
             scene.generation_status.video = "pending"
 
         # Save
-        updated_scene = db.update_scene(scene_id, scene)
+        updated_scene = get_db().update_scene(scene_id, scene)
         return updated_scene
 
     def _recalculate_total_duration(self, storyboard_id: str) -> float:
         """Recalculate total_duration as sum of all scene durations."""
-        scenes = db.get_scenes_by_storyboard(storyboard_id)
+        scenes = get_db().get_scenes_by_storyboard(storyboard_id)
         return sum(scene.video_duration for scene in scenes)
 
     async def add_scene(
@@ -352,7 +350,7 @@ Example format:
         Returns:
             (storyboard, scenes) tuple
         """
-        storyboard = db.get_storyboard(storyboard_id)
+        storyboard = get_db().get_storyboard(storyboard_id)
         if not storyboard:
             raise ValueError(f"Storyboard {storyboard_id} not found")
         
@@ -397,8 +395,8 @@ Example format:
         storyboard.total_duration = self._recalculate_total_duration(storyboard_id)
         
         # Save scene and update storyboard
-        db.create_scene(new_scene)
-        db.update_storyboard(storyboard_id, storyboard)
+        get_db().create_scene(new_scene)
+        get_db().update_storyboard(storyboard_id, storyboard)
         
         # Get all scenes in order
         _, scenes = await self.get_storyboard_with_scenes(storyboard_id)
@@ -420,7 +418,7 @@ Example format:
         Returns:
             (storyboard, scenes) tuple
         """
-        storyboard = db.get_storyboard(storyboard_id)
+        storyboard = get_db().get_storyboard(storyboard_id)
         if not storyboard:
             raise ValueError(f"Storyboard {storyboard_id} not found")
         
@@ -432,7 +430,7 @@ Example format:
         if scene_id not in storyboard.scene_order:
             raise ValueError(f"Scene {scene_id} not found in storyboard")
         
-        scene = db.get_scene(scene_id)
+        scene = get_db().get_scene(scene_id)
         if not scene or scene.storyboard_id != storyboard_id:
             raise ValueError(f"Scene {scene_id} does not belong to storyboard")
         
@@ -443,8 +441,8 @@ Example format:
         storyboard.total_duration = self._recalculate_total_duration(storyboard_id)
         
         # Delete scene and update storyboard
-        db.delete_scene(scene_id)
-        db.update_storyboard(storyboard_id, storyboard)
+        get_db().delete_scene(scene_id)
+        get_db().update_storyboard(storyboard_id, storyboard)
         
         # Get all scenes in order
         _, scenes = await self.get_storyboard_with_scenes(storyboard_id)
@@ -466,13 +464,12 @@ Example format:
         Returns:
             (storyboard, scenes) tuple
         """
-        storyboard = db.get_storyboard(storyboard_id)
+        storyboard = get_db().get_storyboard(storyboard_id)
         if not storyboard:
             raise ValueError(f"Storyboard {storyboard_id} not found")
         
         # Validate all scene IDs exist and belong to storyboard
-        all_scenes = db.get_scenes_by_storyboard(storyboard_id)
-        scene_ids = {scene.id for scene in all_scenes}
+        scene_ids = set(get_db().get_scene_ids_by_storyboard(storyboard_id))
         
         if set(new_scene_order) != scene_ids:
             raise ValueError("Scene order contains invalid or missing scene IDs")
@@ -484,7 +481,7 @@ Example format:
         storyboard.scene_order = new_scene_order
         
         # Update storyboard
-        db.update_storyboard(storyboard_id, storyboard)
+        get_db().update_storyboard(storyboard_id, storyboard)
         
         # Get all scenes in order
         _, scenes = await self.get_storyboard_with_scenes(storyboard_id)
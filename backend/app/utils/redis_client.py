@@ -0,0 +1,34 @@
+"""
+Redis Client
+
+Connects to the optional Redis server used to share state between worker
+processes. Redis is never required: callers fall back to per-process state
+when it is not configured or not reachable.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def connect_redis(url: str, purpose: str):
+    """Connect to Redis for the given purpose (used in log messages).
+
+    Returns None when url is empty, the redis package is missing, or the
+    server can't be reached.
+    """
+    if not url:
+        return None
+    try:
+        import redis
+    except ImportError:
+        logger.warning("REDIS_URL is set but redis package not installed. Run: pip install redis")
+        return None
+    try:
+        client = redis.Redis.from_url(url)
+        client.ping()
+        logger.info(f"Redis {purpose} connected")
+        return client
+    except Exception as e:
+        logger.warning(f"Redis unavailable, {purpose} is per-process only: {e}")
+        return None
@@ -0,0 +1,18 @@
+"""
+Serialization Utilities
+
+Helpers for turning pydantic models into wire-ready JSON without detouring
+through Python-level dicts or str encoding.
+"""
+
+from pydantic import BaseModel
+
+
+def to_json_bytes(model: BaseModel) -> bytes:
+    """Serialize a pydantic model straight to UTF-8 JSON bytes.
+
+    Calls the model's compiled pydantic-core serializer directly, skipping
+    the ``str`` round-trip of ``model_dump_json()``; the result can be
+    written to a response stream or cache as-is.
+    """
+    return model.__pydantic_serializer__.to_json(model)
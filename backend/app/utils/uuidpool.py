@@ -0,0 +1,37 @@
+"""
+UUID Pool
+
+Hands out random (version 4) UUID strings from batches generated with a
+single os.urandom call, so minting ids does not cost a syscall each.
+"""
+
+import os
+import threading
+import uuid
+from typing import List
+
+_BATCH_SIZE = 1024
+
+_pool: List[str] = []
+_lock = threading.Lock()
+
+
+def _refill() -> None:
+    """Generate a new batch of UUID strings into the pool."""
+    buf = os.urandom(16 * _BATCH_SIZE)
+    _pool.extend(
+        str(uuid.UUID(bytes=buf[i:i + 16], version=4))
+        for i in range(0, len(buf), 16)
+    )
+
+
+def next_uuid_str() -> str:
+    """Return a fresh random UUID string, refilling the pool when empty."""
+    with _lock:
+        if not _pool:
+            _refill()
+        return _pool.pop()
+
+
+# A forked worker must not hand out the same ids as its parent
+os.register_at_fork(after_in_child=_pool.clear)
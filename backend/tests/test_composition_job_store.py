@@ -0,0 +1,101 @@
+"""Unit tests for the composition job store."""
+import pytest
+
+from app.models.composition_models import CompositionJobState, CompositionStatus
+from app.services.composition_job_store import CompositionJobStore, _job_key
+
+
+def _job(job_id="job-1", created_at=1_000):
+    return CompositionJobState(
+        job_id=job_id,
+        status=CompositionStatus.PENDING,
+        total_clips=3,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+@pytest.fixture
+def redis_client():
+    """In-memory Redis (the update script needs fakeredis' Lua support)."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return fakeredis.FakeStrictRedis()
+
+
+@pytest.fixture(params=["local", "redis"])
+def store(request):
+    """Run each test against the per-process fallback and against Redis."""
+    if request.param == "local":
+        return CompositionJobStore()
+    return CompositionJobStore(request.getfixturevalue("redis_client"))
+
+
+@pytest.mark.asyncio
+async def test_set_and_get_round_trip(store):
+    """Test a stored job comes back with its field types intact."""
+    await store.set(_job())
+
+    job = await store.get("job-1")
+
+    assert job == _job()
+    assert job.status is CompositionStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_get_unknown_job(store):
+    """Test unknown jobs are reported as None."""
+    assert await store.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_update_changes_fields(store):
+    """Test update sets only the given fields."""
+    await store.set(_job())
+
+    await store.update("job-1", status=CompositionStatus.COMPOSING, progress_percent=30)
+
+    job = await store.get("job-1")
+    assert job.status is CompositionStatus.COMPOSING
+    assert job.progress_percent == 30
+    assert job.total_clips == 3
+
+
+@pytest.mark.asyncio
+async def test_update_ignores_unknown_job(store):
+    """Test updating an unknown job never creates it."""
+    await store.update("missing", progress_percent=50)
+
+    assert await store.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_list_newest_first(store):
+    """Test jobs are listed by creation time, newest first."""
+    await store.set(_job("old", created_at=1_000))
+    await store.set(_job("new", created_at=2_000))
+
+    assert [job.job_id for job in await store.list()] == ["new", "old"]
+
+
+@pytest.mark.asyncio
+async def test_update_after_expiry_leaves_no_partial_hash(redis_client):
+    """Test an update racing with expiry doesn't recreate the job hash."""
+    store = CompositionJobStore(redis_client)
+    await store.set(_job())
+    redis_client.delete(_job_key("job-1"))
+
+    await store.update("job-1", progress_percent=90)
+
+    assert not redis_client.exists(_job_key("job-1"))
+
+
+@pytest.mark.asyncio
+async def test_file_location_round_trip(store):
+    """Test a finished job keeps both its file path and rendering host."""
+    await store.set(_job())
+
+    await store.update("job-1", file_path="/tmp/out.mp4", file_host="worker-a")
+
+    job = await store.get("job-1")
+    assert (job.file_path, job.file_host) == ("/tmp/out.mp4", "worker-a")
@@ -0,0 +1,138 @@
+"""Unit tests for the FirestoreDatabase in-memory caches and indexes."""
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.config import settings
+from app.firestore_database import FirestoreDatabase
+from app.models.storyboard_models import Storyboard, StoryboardScene
+
+
+@pytest.fixture
+def make_db(monkeypatch):
+    """Build a FirestoreDatabase backed by mocks instead of Firestore."""
+    def _init_firestore(self):
+        self._db = MagicMock()
+        self._storyboards_col = MagicMock()
+        self._scenes_col = MagicMock()
+        # Every document lookup misses
+        self._storyboards_col.document.return_value.get.return_value.exists = False
+        self._scenes_col.document.return_value.get.return_value.exists = False
+
+    def _make(maxsize=100):
+        monkeypatch.setattr(settings, "DB_CACHE_MAXSIZE", maxsize)
+        monkeypatch.setattr(settings, "REDIS_URL", "")
+        monkeypatch.setattr(FirestoreDatabase, "_init_firestore", _init_firestore)
+        return FirestoreDatabase()
+
+    return _make
+
+
+def _scene(scene_id, storyboard_id="sb-1", prediction_id=None):
+    return StoryboardScene(
+        id=scene_id,
+        storyboard_id=storyboard_id,
+        text="A scene",
+        style_prompt="cinematic",
+        replicate_image_prediction_id=prediction_id,
+    )
+
+
+def _storyboard(storyboard_id, scene_ids):
+    return Storyboard(
+        storyboard_id=storyboard_id,
+        creative_brief="brief",
+        selected_mood={"name": "calm"},
+        scene_order=scene_ids,
+    )
+
+
+def test_evicted_scene_leaves_prediction_index(make_db):
+    """Test LRU eviction also drops the evicted scene's prediction id."""
+    db = make_db(maxsize=2)
+    for i in range(3):
+        db.create_scene(_scene(f"s{i}", prediction_id=f"p{i}"))
+
+    assert "s0" not in db._cache_scenes
+    assert "p0" not in db._idx_image_pred
+    assert db.get_scene_by_image_prediction_id("p2").id == "s2"
+
+
+def test_replaced_prediction_id_is_unindexed(make_db):
+    """Test updating a scene's prediction id in the cache drops the old entry."""
+    db = make_db()
+    db.create_scene(_scene("s1", prediction_id="old"))
+    db._cache_scene(_scene("s1", prediction_id="new"))
+
+    assert "old" not in db._idx_image_pred
+    assert db._idx_image_pred["new"].id == "s1"
+
+
+def test_missing_scene_is_negative_cached(make_db):
+    """Test repeated lookups of a missing scene hit Firestore once."""
+    db = make_db()
+
+    assert db.get_scene("gone") is None
+    assert db.get_scene("gone") is None
+    assert db._scenes_col.document.return_value.get.call_count == 1
+
+
+def test_created_scene_clears_negative_cache(make_db):
+    """Test a scene created after a miss is served from the cache."""
+    db = make_db()
+    assert db.get_scene("s1") is None
+
+    db.create_scene(_scene("s1"))
+
+    assert db.get_scene("s1").id == "s1"
+    assert db._scenes_col.document.return_value.get.call_count == 1
+
+
+def test_storyboard_scene_index_tracks_creates_and_deletes(make_db):
+    """Test the storyboard's scene-id index follows this process's writes."""
+    db = make_db()
+    scenes = [_scene(f"s{i}") for i in range(3)]
+    db.create_storyboard_with_scenes(_storyboard("sb-1", [s.id for s in scenes]), scenes)
+
+    db.create_scene(_scene("s3"))
+    db.delete_scene("s0")
+
+    assert db._idx_storyboard_scenes["sb-1"] == {"s1", "s2", "s3"}
+    assert [s.id for s in db.get_scenes_by_storyboard("sb-1")] == ["s1", "s2", "s3"]
+    db._scenes_col.where.assert_not_called()
+
+
+def test_concurrent_scene_writes_and_reads(make_db):
+    """Test threads creating and listing scenes never break the caches."""
+    db = make_db(maxsize=8)
+    scenes = [_scene(f"s{i}") for i in range(3)]
+    db.create_storyboard_with_scenes(_storyboard("sb-1", [s.id for s in scenes]), scenes)
+    db._db.get_all.return_value = []
+    errors = []
+
+    def writer(start):
+        try:
+            for i in range(start, start + 200):
+                db.create_scene(_scene(f"s{i}", prediction_id=f"p{i}"))
+        except Exception as e:
+            errors.append(e)
+
+    def reader():
+        try:
+            for _ in range(200):
+                db.get_scenes_by_storyboard("sb-1")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n * 1000,)) for n in range(4)]
+    threads += [threading.Thread(target=reader) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(db._cache_scenes) <= 8
+    assert all(scene.replicate_image_prediction_id == pred
+               for pred, scene in db._idx_image_pred.items())
@@ -177,3 +177,60 @@ def test_multiple_daily_generations_tracking(temp_metrics):
     
     assert temp_metrics.get_daily_count(today) == 5
 
+
+
+def test_get_stats_refreshes_after_record(temp_metrics):
+    """Test cached stats are recomputed once a new call is recorded."""
+    first = temp_metrics.get_stats()
+    assert temp_metrics.get_stats() is first
+    
+    temp_metrics.record_kontext_call(success=True, duration_seconds=5.0)
+    
+    assert temp_metrics.get_stats()["kontext"]["total_calls"] == first["kontext"]["total_calls"] + 1
+
+
+def test_reset_then_record(temp_metrics):
+    """Test metrics can be recorded again after a reset."""
+    temp_metrics.record_kontext_call(success=True, duration_seconds=5.0)
+    temp_metrics.reset()
+    
+    assert temp_metrics.get_stats()["kontext"]["total_calls"] == 0
+    
+    temp_metrics.record_pil_call(success=True, duration_seconds=2.0)
+    
+    assert temp_metrics.get_daily_count() == 1
+
+
+def test_get_daily_counts(temp_metrics):
+    """Test batched daily counts, including dates with no generations."""
+    today = datetime.now().date().isoformat()
+    temp_metrics.record_kontext_call(success=True, duration_seconds=5.0)
+    temp_metrics.record_pil_call(success=True, duration_seconds=2.0)
+    
+    counts = temp_metrics.get_daily_counts([today, "2000-01-01"])
+    
+    assert counts == {today: 2, "2000-01-01": 0}
+    assert list(counts) == [today, "2000-01-01"]
+
+
+def test_health_checks_at_thresholds(temp_metrics):
+    """Test integer health checks, including exactly-at-threshold rates."""
+    # Too few calls to judge
+    temp_metrics.record_kontext_call(success=False, duration_seconds=1.0)
+    assert temp_metrics.is_kontext_healthy()
+    
+    temp_metrics.reset()
+    for _ in range(19):
+        temp_metrics.record_kontext_call(success=True, duration_seconds=1.0)
+    temp_metrics.record_kontext_call(success=False, duration_seconds=1.0)
+    temp_metrics.record_fallback()
+    temp_metrics.record_fallback()
+    
+    # 19/20 = 95% success and 2/20 = 10% fallback are both still healthy
+    assert temp_metrics.is_kontext_healthy()
+    assert temp_metrics.is_fallback_rate_healthy()
+    
+    temp_metrics.record_kontext_call(success=False, duration_seconds=1.0)
+    temp_metrics.record_fallback()
+    assert not temp_metrics.is_kontext_healthy()
+    assert not temp_metrics.is_fallback_rate_healthy()
@@ -0,0 +1,21 @@
+"""Unit tests for the UUID pool."""
+import uuid
+
+from app.utils import uuidpool
+from app.utils.uuidpool import next_uuid_str
+
+
+def test_next_uuid_str_is_version4():
+    """Pooled ids are canonical random UUID strings."""
+    value = next_uuid_str()
+    parsed = uuid.UUID(value)
+    assert str(parsed) == value
+    assert parsed.version == 4
+    assert parsed.variant == uuid.RFC_4122
+
+
+def test_next_uuid_str_unique_across_refills():
+    """Ids stay unique when the pool is drained and refilled."""
+    count = uuidpool._BATCH_SIZE * 2 + 10
+    ids = {next_uuid_str() for _ in range(count)}
+    assert len(ids) == count
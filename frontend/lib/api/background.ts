@@ -1,9 +1,26 @@
-import type { BackgroundAssetStatus, BackgroundGenerationRequest, BackgroundGenerationResponse } from '@/types/background.types';
+import type {
+  BackgroundAssetStatus,
+  BackgroundGenerationJobResponse,
+  BackgroundGenerationJobStatus,
+  BackgroundGenerationRequest,
+  BackgroundGenerationResponse,
+} from '@/types/background.types';
 import * as assetAPI from './asset';
 
 const API_PREFIX = 'background';
 const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
+const JOB_POLL_INTERVAL_MS = 2000;
+// Give up after 5 minutes; generation normally finishes well within that
+const JOB_MAX_POLL_ATTEMPTS = 150;
+
+/**
+ * Generate backgrounds from a creative brief.
+ *
+ * The backend runs generation as a job and returns 202 with a job ID; this
+ * polls the job until it finishes (or JOB_MAX_POLL_ATTEMPTS is reached) and
+ * resolves with the generated assets.
+ */
 export async function generateBackgrounds(
   creativeBrief: BackgroundGenerationRequest
 ): Promise<BackgroundGenerationResponse> {
@@ -20,7 +37,27 @@ export async function generateBackgrounds(
     throw new Error(error.detail || error.message || 'Failed to generate backgrounds');
   }
   
-  return response.json();
+  const { job_id }: BackgroundGenerationJobResponse = await response.json();
+  
+  for (let attempt = 0; attempt < JOB_MAX_POLL_ATTEMPTS; attempt++) {
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    
+    const statusResponse = await fetch(`${API_URL}/api/background/generate/status/${job_id}`);
+    if (!statusResponse.ok) {
+      const error = await statusResponse.json().catch(() => ({ detail: 'Failed to get background generation status' }));
+      throw new Error(error.detail || error.message || 'Failed to get background generation status');
+    }
+    
+    const job: BackgroundGenerationJobStatus = await statusResponse.json();
+    if (job.status === 'completed') {
+      return { success: true, backgrounds: job.backgrounds, message: job.message };
+    }
+    if (job.status === 'failed') {
+      throw new Error(job.error || 'Failed to generate backgrounds');
+    }
+  }
+  
+  throw new Error('Timed out waiting for background generation');
 }
 
 export async function getBackgroundAsset(assetId: string, userId: string): Promise<BackgroundAssetStatus> {
@@ -30,3 +30,24 @@ export interface BackgroundGenerationResponse {
   message?: string | null;
 }
 
+
+/**
+ * Response from starting a background generation job (202 Accepted).
+ */
+export interface BackgroundGenerationJobResponse {
+  success: boolean;
+  job_id: string;
+  message?: string | null;
+}
+
+/**
+ * Status of a background generation job.
+ */
+export interface BackgroundGenerationJobStatus {
+  job_id: string;
+  status: 'pending' | 'processing' | 'completed' | 'failed';
+  backgrounds: BackgroundAssetStatus[];
+  message?: string | null;
+  error?: string | null;
+  error_status?: number | null;
+}
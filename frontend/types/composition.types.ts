@@ -58,8 +58,8 @@ export interface CompositionJobStatus {
   file_size_mb: number | null;
   duration_seconds: number | null;
   error: string | null;
-  created_at: string;
-  updated_at: string;
+  created_at: number; // epoch milliseconds
+  updated_at: number; // epoch milliseconds
 }
 
 /**